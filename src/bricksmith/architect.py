@@ -13,14 +13,13 @@ import re
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 from rich.table import Table
 
-from .architect_dspy import ArchitectRefiner
 from .config import AppConfig
 from .gemini_client import GeminiClient
 from .logos import LogoKitHandler
@@ -33,6 +32,9 @@ from .models import (
     ConversationStatus,
 )
 
+if TYPE_CHECKING:
+    from .architect_dspy import ArchitectRefiner
+
 console = Console()
 DEFAULT_BRANDING_FILE = Path("prompts/branding/databricks_default.txt")
 
@@ -179,7 +181,7 @@ class ArchitectChatbot:
         self.logo_handler = LogoKitHandler(config.logo_kit)
 
         # Initialize DSPy refiner (deferred to allow for lazy loading)
-        self._refiner: Optional[ArchitectRefiner] = None
+        self._refiner: Optional["ArchitectRefiner"] = None
         self._dspy_model = dspy_model
 
         # Initialize MCP enricher if callback provided and enrichment enabled
@@ -207,13 +209,28 @@ class ArchitectChatbot:
         self._reference_image_analysis: str = ""
 
     @property
-    def refiner(self) -> ArchitectRefiner:
+    def refiner(self) -> "ArchitectRefiner":
         """Lazy-load the DSPy refiner."""
         if self._refiner is None:
+            # dspy is slow to import; only pay for it once a turn needs the LLM
+            from .architect_dspy import ArchitectRefiner
+
             console.print("[dim]Initializing DSPy architect with Databricks...[/dim]")
             self._refiner = ArchitectRefiner(model=self._dspy_model)
         return self._refiner
 
+    @property
+    def _logo_names(self) -> list[str]:
+        """Names of the loaded logos."""
+        return self._logo_name_list
+
+    @_logo_names.setter
+    def _logo_names(self, names: list[str]) -> None:
+        self._logo_name_list = names
+        # Joined once here rather than on every turn; the model is sent the
+        # same logo list each time
+        self._available_logos = ", ".join(names)
+
     def analyze_reference_image(self, image_path: Path) -> str:
         """Analyze a reference architecture image and append the result.
 
@@ -370,7 +387,7 @@ class ArchitectChatbot:
         response, updated_arch, ready = self.refiner.process_turn(
             user_message=user_input,
             conversation_history=self._session.get_history_json(),
-            available_logos=", ".join(self._logo_names),
+            available_logos=self._available_logos,
             current_architecture=self._session.get_architecture_json(),
             custom_context=enriched_context,
             reference_prompt=self._reference_prompt,
@@ -457,8 +474,8 @@ class ArchitectChatbot:
         try:
             prompt, rationale = self.refiner.create_diagram_prompt(
                 conversation_summary=conversation_summary,
-                architecture_json=json.dumps(arch, indent=2),
-                available_logos=", ".join(self._logo_names),
+                architecture_json=self._session.get_architecture_json(),
+                available_logos=self._available_logos,
                 reference_prompt=self._reference_prompt,
             )
 
@@ -556,9 +573,7 @@ class ArchitectChatbot:
         (output_dir / "prompt.txt").write_text(branded_prompt)
 
         # Save architecture JSON
-        (output_dir / "architecture.json").write_text(
-            json.dumps(self._session.current_architecture, indent=2)
-        )
+        (output_dir / "architecture.json").write_text(self._session.get_architecture_json())
 
         # Save rationale
         (output_dir / "rationale.txt").write_text(rationale)
@@ -796,30 +811,32 @@ class ArchitectChatbot:
         chatbot._logo_names = [logo.name for logo in chatbot._logos]
         console.print(f"  Loaded {len(chatbot._logos)} logos")
 
-        # Restore session state
-        chatbot._session = ArchitectSession(
-            session_id=session_data["session_id"],
-            initial_problem=session_data["initial_problem"],
-            available_logos=session_data.get("available_logos", chatbot._logo_names),
-            custom_context=session_data.get("custom_context"),
-            created_at=session_data.get("created_at", datetime.now().isoformat()),
-            status=ConversationStatus(session_data.get("status", "active")),
-            current_architecture=session_data.get(
-                "current_architecture", {"components": [], "connections": []}
-            ),
+        # Restore session state and turns. The session file was written by
+        # save_session, so skip re-validation.
+        chatbot._session = ArchitectSession.from_trusted_dict(
+            {
+                "session_id": session_data["session_id"],
+                "initial_problem": session_data["initial_problem"],
+                "available_logos": session_data.get("available_logos", chatbot._logo_names),
+                "custom_context": session_data.get("custom_context"),
+                "created_at": session_data.get("created_at", datetime.now().isoformat()),
+                "status": ConversationStatus(session_data.get("status", "active")),
+                "current_architecture": session_data.get(
+                    "current_architecture", {"components": [], "connections": []}
+                ),
+                "turns": [
+                    {
+                        "turn_number": turn_data["turn_number"],
+                        "user_input": turn_data["user_input"],
+                        "architect_response": turn_data["architect_response"],
+                        "architecture_snapshot": turn_data.get("architecture_snapshot"),
+                        "timestamp": turn_data.get("timestamp", ""),
+                    }
+                    for turn_data in session_data.get("turns", [])
+                ],
+            }
         )
 
-        # Restore turns
-        for turn_data in session_data.get("turns", []):
-            turn = ArchitectTurn(
-                turn_number=turn_data["turn_number"],
-                user_input=turn_data["user_input"],
-                architect_response=turn_data["architect_response"],
-                architecture_snapshot=turn_data.get("architecture_snapshot"),
-                timestamp=turn_data.get("timestamp", ""),
-            )
-            chatbot._session.turns.append(turn)
-
         # Restore custom context, reference prompt, and image analysis
         chatbot._custom_context = session_data.get("_custom_context", "")
         chatbot._reference_prompt = session_data.get("_reference_prompt", "")
@@ -1,5 +1,8 @@
 """Command-line interface for Bricksmith."""
 
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -25,10 +28,56 @@ from .mlflow_tracker import MLflowTracker
 from .prompts import PromptBuilder
 from .prompt_refiner import PromptRefiner
 from .conversation import ConversationChatbot
-from .models import ConversationConfig, ArchitectConfig
+from .models import ConversationConfig, ArchitectConfig, LogoInfo
 
 console = Console()
 
+# Turns logo file names (e.g. "delta-lake_logo") into spaced display names
+_LOGO_NAME_SPACES = str.maketrans("-_", "  ")
+
+# Logo constraints a generate-raw prompt must contain (lower-cased for matching)
+_CRITICAL_LOGO_CONSTRAINTS = (
+    "reuse uploaded logos exactly",
+    "scale all logos uniformly",
+    "no filenames",
+)
+
+
+def _logo_name_variants(name: str) -> list[str]:
+    """Return the distinct ways a logo may be mentioned in a prompt.
+
+    Args:
+        name: Lower-case logo name
+
+    Returns:
+        Aliases to look for, in priority order and without duplicates
+    """
+    variants = [
+        name,
+        name.translate(_LOGO_NAME_SPACES),
+        name.replace("-logo", "").replace("_logo", ""),
+        name.replace("00-", "").replace("-logo", "").replace("_logo", ""),
+    ]
+
+    # Special handling for Unity Catalog
+    if "unity" in name or "uc" in name:
+        variants.extend(["unity catalog", "unity-catalog", "uc", "governance", "catalog"])
+
+    return list(dict.fromkeys(variants))
+
+
+def _logo_image_number(logos: list[LogoInfo], keyword: str) -> Optional[int]:
+    """Return the 1-based image number of the first logo whose name contains keyword.
+
+    Args:
+        logos: Logos in the order they are sent to the model
+        keyword: Lower-case text to look for in the logo name
+
+    Returns:
+        Image number, or None if no logo matches
+    """
+    return next((i for i, logo in enumerate(logos, 1) if keyword in logo.name.lower()), None)
+
 
 class Context:
     """Shared context for CLI commands."""
@@ -105,6 +154,7 @@ def main(ctx: click.Context, config: Optional[Path], image_provider: Optional[st
     if image_provider is not None:
         obj.set_image_provider(image_provider)
     ctx.obj = obj
+    ctx.call_on_close(obj.mlflow_tracker.close)
 
 
 @main.command()
@@ -166,7 +216,9 @@ def list_runs(ctx: Context, filter_string: Optional[str], max_results: int):
         ctx.mlflow_tracker.initialize()
 
         # Get runs
-        runs = ctx.mlflow_tracker.list_runs(filter_string=filter_string, max_results=max_results)
+        runs = ctx.mlflow_tracker.list_runs(
+            filter_string=filter_string, max_results=max_results, include_data=True
+        )
 
         if not runs:
             console.print("[yellow]No runs found[/yellow]")
@@ -344,6 +396,12 @@ def show_run(ctx: Context, run_id: str):
     default=True,
     help="Apply official Databricks brand style guide (enabled by default)",
 )
+@click.option(
+    "--max-workers",
+    default=4,
+    type=click.IntRange(min=1),
+    help="Maximum concurrent generation requests when --count > 1 (default: 4)",
+)
 @click.pass_obj
 def generate_raw(
     ctx: Context,
@@ -365,6 +423,7 @@ def generate_raw(
     avoid: Optional[str],
     feedback: bool,
     databricks_style: bool,
+    max_workers: int,
 ):
     """Generate a diagram from a raw prompt file with logo kit attached.
 
@@ -397,6 +456,10 @@ def generate_raw(
                 console.print(f"[yellow]Warning: Ignoring invalid tag '{tag_str}'[/yellow]")
         run_group = tags.get("run_group") or tags.get("group")
 
+        # Connect to Gemini while MLflow, logos and the prompt are prepared
+        if isinstance(ctx.image_generator, GeminiClient):
+            ctx.image_generator.warm_up()
+
         # Initialize MLflow (use default experiment name from config)
         console.print("[bold]Initializing MLflow...[/bold]")
         ctx.mlflow_tracker.initialize()
@@ -501,29 +564,12 @@ Ensure the output does NOT contain any of the above qualities or elements. Doubl
 
         # Build mapping based on logo names found in prompt
         for idx, logo in enumerate(logos, 1):
-            logo_name_variants = [
-                logo.name.lower(),
-                logo.name.replace("-", " ").replace("_", " ").lower(),
-                logo.name.replace("-logo", "").replace("_logo", "").lower(),
-                logo.name.replace("00-", "").replace("-logo", "").replace("_logo", "").lower(),
-            ]
-
-            # Special handling for Unity Catalog
-            if (
-                "unity" in logo.name.lower()
-                or "uc" in logo.name.lower()
-                or "00-unity" in logo.name.lower()
-            ):
-                logo_name_variants.extend(
-                    ["unity catalog", "unity-catalog", "uc", "governance", "catalog"]
-                )
-
-            for variant in logo_name_variants:
+            # Variants often coincide, so they are deduped before each one is
+            # scanned for in the prompt
+            for variant in _logo_name_variants(logo.name.lower()):
                 if variant in prompt_lower:
                     # Find context around the mention
-                    logo_display = (
-                        logo.name.replace("-", " ").replace("_", " ").replace("00-", "").title()
-                    )
+                    logo_display = logo.name.translate(_LOGO_NAME_SPACES).title()
                     component_logo_mapping.append(
                         f"- Components/text mentioning '{logo_display}' or related terms → Use Image {idx} ({logo_display} logo)"
                     )
@@ -531,27 +577,24 @@ Ensure the output does NOT contain any of the above qualities or elements. Doubl
 
         # Also add explicit mappings for common patterns
         if "azure" in prompt_lower:
-            azure_logo = next((logo for logo in logos if "azure" in logo.name.lower()), None)
-            if azure_logo:
-                idx = logos.index(azure_logo) + 1
+            azure_image = _logo_image_number(logos, "azure")
+            if azure_image is not None:
                 component_logo_mapping.append(
-                    f"- Azure services/components (Azure Data Factory, Azure Synapse, etc.) → Use Image {idx} (Azure logo)"
+                    f"- Azure services/components (Azure Data Factory, Azure Synapse, etc.) → Use Image {azure_image} (Azure logo)"
                 )
 
         if "databricks" in prompt_lower:
-            db_logo = next((logo for logo in logos if "databricks" in logo.name.lower()), None)
-            if db_logo:
-                idx = logos.index(db_logo) + 1
+            databricks_image = _logo_image_number(logos, "databricks")
+            if databricks_image is not None:
                 component_logo_mapping.append(
-                    f"- Databricks components → Use Image {idx} (Databricks logo)"
+                    f"- Databricks components → Use Image {databricks_image} (Databricks logo)"
                 )
 
         if "delta" in prompt_lower or "delta lake" in prompt_lower:
-            delta_logo = next((logo for logo in logos if "delta" in logo.name.lower()), None)
-            if delta_logo:
-                idx = logos.index(delta_logo) + 1
+            delta_image = _logo_image_number(logos, "delta")
+            if delta_image is not None:
                 component_logo_mapping.append(
-                    f"- Delta Lake components → Use Image {idx} (Delta Lake logo)"
+                    f"- Delta Lake components → Use Image {delta_image} (Delta Lake logo)"
                 )
 
         # Keep logo mapping minimal to avoid confusing the model
@@ -562,13 +605,9 @@ Ensure the output does NOT contain any of the above qualities or elements. Doubl
         final_prompt = "\n\n".join(sections)
 
         # Ensure critical constraints are present
-        critical_constraints = [
-            "Reuse uploaded logos EXACTLY",
-            "Scale all logos uniformly",
-            "NO filenames",
-        ]
+        final_prompt_lower = final_prompt.lower()
         has_constraints = all(
-            constraint.lower() in final_prompt.lower() for constraint in critical_constraints
+            constraint in final_prompt_lower for constraint in _CRITICAL_LOGO_CONSTRAINTS
         )
         # Add simple reminder - avoid verbose instructions that cause numbered circles
         if not has_constraints:
@@ -577,10 +616,6 @@ Ensure the output does NOT contain any of the above qualities or elements. Doubl
         # Convert logos to image parts (once, reused for all generations)
         logo_parts = [ctx.logo_handler.to_image_part(logo) for logo in logos]
 
-        import time
-        from datetime import datetime
-        import json
-
         # Create date-based output folder: outputs/YYYY-MM-DD/{run_name}/
         # Files are timestamped: diagram_{HHMMSS}.png, metadata_{HHMMSS}.json
         now = datetime.now()
@@ -594,144 +629,167 @@ Ensure the output does NOT contain any of the above qualities or elements. Doubl
 
         output_images = []
 
-        for i in range(count):
-            iteration = f" ({i+1}/{count})" if count > 1 else ""
-            console.print(f"\n[bold]Generating diagram{iteration}...[/bold]\n")
-
-            # Start MLflow run
-            run_name_final = batch_name if count == 1 else f"{batch_name}-{i+1}"
-            run_id = ctx.mlflow_tracker.start_run(run_name=run_name_final)
-
+        def _generate() -> tuple[tuple[bytes, str, dict], float]:
+            start_time = time.time()
+            result = ctx.image_generator.generate_image(
+                prompt=final_prompt,
+                logo_parts=logo_parts,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k if top_k > 0 else None,
+                presence_penalty=presence_penalty,
+                frequency_penalty=frequency_penalty,
+                system_instruction=system_instruction,
+                image_size=size,
+                aspect_ratio=aspect_ratio,
+            )
+            return result, time.time() - start_time
+
+        # Parameters shared by every run in the batch; only the iteration varies
+        batch_params = {
+            "prompt_file": prompt_file.name,
+            "prompt_template_id": "raw",
+            "logo_count": len(logos),
+            "logo_dir": str(logo_path),
+            "branding_file": branding.name if branding else "none",
+            "temperature": temperature,
+            "top_p": top_p,
+            "top_k": top_k if top_k > 0 else None,
+            "presence_penalty": presence_penalty,
+            "frequency_penalty": frequency_penalty,
+            "image_size": size,
+            "aspect_ratio": aspect_ratio,
+            "batch_count": count,
+            "has_custom_system_instruction": system_instruction is not None,
+        }
+
+        # Generation is network-bound, so dispatch all requests up front and
+        # log/save the results in order as they complete. With --feedback each
+        # image is reviewed before the next one is requested.
+        workers = 1 if feedback else min(max_workers, count)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            generations = [] if feedback else [pool.submit(_generate) for _ in range(count)]
             try:
-                # Log parameters
-                params = {
-                    "prompt_file": prompt_file.name,
-                    "prompt_template_id": "raw",
-                    "logo_count": len(logos),
-                    "logo_dir": str(logo_path),
-                    "branding_file": branding.name if branding else "none",
-                    "temperature": temperature,
-                    "top_p": top_p,
-                    "top_k": top_k if top_k > 0 else None,
-                    "presence_penalty": presence_penalty,
-                    "frequency_penalty": frequency_penalty,
-                    "image_size": size,
-                    "aspect_ratio": aspect_ratio,
-                    "iteration": i + 1,
-                    "batch_count": count,
-                    "has_custom_system_instruction": system_instruction is not None,
-                }
-                ctx.mlflow_tracker.log_parameters(params)
-
-                # Log tags
-                for key, value in tags.items():
-                    mlflow.set_tag(key, value)
-
-                # Log prompt as artifact
-                ctx.mlflow_tracker.log_prompt(final_prompt, "prompt.txt")
-
-                # Generate image
-                start_time = time.time()
-
-                image_bytes, response_text, metadata = ctx.image_generator.generate_image(
-                    prompt=final_prompt,
-                    logo_parts=logo_parts,
-                    temperature=temperature,
-                    top_p=top_p,
-                    top_k=top_k if top_k > 0 else None,
-                    presence_penalty=presence_penalty,
-                    frequency_penalty=frequency_penalty,
-                    system_instruction=system_instruction,
-                    image_size=size,
-                    aspect_ratio=aspect_ratio,
-                )
-
-                generation_time = time.time() - start_time
-                ctx.mlflow_tracker.log_metrics({"generation_time_seconds": generation_time})
-
-                # Save image to batch folder with timestamp and params
-                # Get fresh timestamp for each generation
-                gen_time = datetime.now().strftime("%H%M%S")
-                # Format temperature for filename (0.8 -> t08, 1.0 -> t10)
-                temp_str = f"t{int(temperature * 10):02d}"
-                image_filename = f"diagram_{gen_time}_{temp_str}.png"
-                image_path = batch_dir / image_filename
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
-
-                # Save metadata for this generation with matching filename base
-                meta_filename = f"metadata_{gen_time}_{temp_str}.json"
-                run_metadata = {
-                    "run_id": run_id,
-                    "run_name": run_name_final,
-                    "run_group": run_group,
-                    "tags": tags,
-                    "timestamp": now.isoformat(),
-                    "iteration": i + 1,
-                    "generation_time_seconds": generation_time,
-                    "temperature": temperature,
-                    "top_p": top_p,
-                    "image_size": size,
-                    "aspect_ratio": aspect_ratio,
-                    "logo_count": len(logos),
-                    "prompt_file": str(prompt_file),
-                    "branding_file": str(branding) if branding else None,
-                    **metadata,
-                }
-                (batch_dir / meta_filename).write_text(json.dumps(run_metadata, indent=2))
-
-                ctx.mlflow_tracker.log_output_image(image_path)
-                ctx.mlflow_tracker.log_metrics({"success": 1})
-
-                output_images.append(image_filename)
-                console.print(f"[green]✓ Saved: {image_filename}[/green]")
-
-                # Collect quick feedback if enabled
-                if feedback:
-                    console.print(f"\n[bold]Quick feedback for {image_filename}:[/bold]")
-                    console.print(f"  [dim]Image at: {image_path}[/dim]")
-
-                    score_input = click.prompt(
-                        "  Score (1-10, or Enter to skip)",
-                        default="",
-                        show_default=False,
+                for i in range(count):
+                    generation = generations[i] if generations else pool.submit(_generate)
+                    iteration = f" ({i+1}/{count})" if count > 1 else ""
+                    console.print(f"\n[bold]Generating diagram{iteration}...[/bold]\n")
+
+                    # Start MLflow run
+                    run_name_final = batch_name if count == 1 else f"{batch_name}-{i+1}"
+                    run_id = ctx.mlflow_tracker.start_run(
+                        run_name=run_name_final, tags=tags or None
                     )
 
-                    user_score = None
-                    if score_input.strip():
-                        try:
-                            user_score = int(score_input)
-                            if user_score < 1 or user_score > 10:
-                                console.print("  [yellow]Score out of range, skipping[/yellow]")
-                                user_score = None
-                        except ValueError:
-                            console.print("  [yellow]Invalid score, skipping[/yellow]")
-
-                    user_comment = ""
-                    if user_score is not None:
-                        user_comment = click.prompt(
-                            "  Comment (optional, Enter to skip)",
-                            default="",
-                            show_default=False,
-                        )
+                    try:
+                        # Log parameters
+                        ctx.mlflow_tracker.log_parameters({**batch_params, "iteration": i + 1})
 
-                    if user_score is not None:
-                        ctx.mlflow_tracker.log_metrics({"user_score": user_score})
-                        if user_comment:
-                            mlflow.set_tag("user_comment", user_comment[:500])
+                        # Log prompt as artifact
+                        ctx.mlflow_tracker.log_prompt(final_prompt, "prompt.txt")
 
-                        # Save feedback to file with matching timestamp
-                        feedback_data = {"score": user_score, "comment": user_comment}
-                        (batch_dir / f"feedback_{gen_time}.json").write_text(
-                            json.dumps(feedback_data, indent=2)
+                        # Wait for this image's generation
+                        (image_bytes, response_text, metadata), generation_time = (
+                            generation.result()
                         )
-                        console.print("  [green]✓ Feedback saved[/green]")
 
-                ctx.mlflow_tracker.end_run("FINISHED")
+                        # Save image to batch folder with timestamp and params
+                        # Get fresh timestamp for each generation
+                        gen_time = datetime.now().strftime("%H%M%S")
+                        # Concurrent generations can finish within the same second; keep the
+                        # suffix in the first "_" field so results_service can pair feedback
+                        if count > 1:
+                            gen_time = f"{gen_time}-{i+1}"
+                        # Format temperature for filename (0.8 -> t08, 1.0 -> t10)
+                        temp_str = f"t{int(temperature * 10):02d}"
+                        image_filename = f"diagram_{gen_time}_{temp_str}.png"
+                        image_path = batch_dir / image_filename
+                        image_path.write_bytes(image_bytes)
+                        # Start the upload now so it overlaps the metadata write/feedback
+                        ctx.mlflow_tracker.log_output_image(image_path)
+
+                        # Save metadata for this generation with matching filename base
+                        meta_filename = f"metadata_{gen_time}_{temp_str}.json"
+                        run_metadata = {
+                            "run_id": run_id,
+                            "run_name": run_name_final,
+                            "run_group": run_group,
+                            "tags": tags,
+                            "timestamp": now.isoformat(),
+                            "iteration": i + 1,
+                            "generation_time_seconds": generation_time,
+                            "temperature": temperature,
+                            "top_p": top_p,
+                            "image_size": size,
+                            "aspect_ratio": aspect_ratio,
+                            "logo_count": len(logos),
+                            "prompt_file": str(prompt_file),
+                            "branding_file": str(branding) if branding else None,
+                            **metadata,
+                        }
+                        (batch_dir / meta_filename).write_text(json.dumps(run_metadata, indent=2))
+
+                        # One log_batch request for both metrics (and the buffered params)
+                        ctx.mlflow_tracker.log_metrics(
+                            {"generation_time_seconds": generation_time, "success": 1}
+                        )
 
-            except Exception as e:
-                ctx.mlflow_tracker.end_run("FAILED")
-                console.print(f"[red]✗ Failed: {e}[/red]")
+                        output_images.append(image_filename)
+                        console.print(f"[green]✓ Saved: {image_filename}[/green]")
+
+                        # Collect quick feedback if enabled
+                        if feedback:
+                            console.print(f"\n[bold]Quick feedback for {image_filename}:[/bold]")
+                            console.print(f"  [dim]Image at: {image_path}[/dim]")
+
+                            score_input = click.prompt(
+                                "  Score (1-10, or Enter to skip)",
+                                default="",
+                                show_default=False,
+                            )
+
+                            user_score = None
+                            if score_input.strip():
+                                try:
+                                    user_score = int(score_input)
+                                    if user_score < 1 or user_score > 10:
+                                        console.print(
+                                            "  [yellow]Score out of range, skipping[/yellow]"
+                                        )
+                                        user_score = None
+                                except ValueError:
+                                    console.print("  [yellow]Invalid score, skipping[/yellow]")
+
+                            user_comment = ""
+                            if user_score is not None:
+                                user_comment = click.prompt(
+                                    "  Comment (optional, Enter to skip)",
+                                    default="",
+                                    show_default=False,
+                                )
+
+                            if user_score is not None:
+                                ctx.mlflow_tracker.log_metrics({"user_score": user_score})
+                                if user_comment:
+                                    mlflow.set_tag("user_comment", user_comment[:500])
+
+                                # Save feedback to file with matching timestamp
+                                feedback_data = {"score": user_score, "comment": user_comment}
+                                (batch_dir / f"feedback_{gen_time}.json").write_text(
+                                    json.dumps(feedback_data, indent=2)
+                                )
+                                console.print("  [green]✓ Feedback saved[/green]")
+
+                        ctx.mlflow_tracker.end_run("FINISHED")
+
+                    except Exception as e:
+                        ctx.mlflow_tracker.end_run("FAILED")
+                        console.print(f"[red]✗ Failed: {e}[/red]")
+            except BaseException:
+                # Don't leave paid generations running for results nobody reads
+                for pending in generations:
+                    pending.cancel()
+                raise
 
         console.print(f"\n[bold green]Done! Generated {len(output_images)} image(s)[/bold green]")
         console.print(f"  {batch_dir}/")
@@ -859,9 +917,11 @@ def refine(
         bricksmith refine abc123 --feedback "logos not used, text is blurry"
         bricksmith refine abc123 --feedback "need more spacing between layers" --count 3
     """
-    import time
-
     try:
+        # Connect to Gemini while the original run and logos are loaded
+        if isinstance(ctx.image_generator, GeminiClient):
+            ctx.image_generator.warm_up()
+
         # Initialize MLflow
         console.print("[bold]Initializing MLflow...[/bold]")
         ctx.mlflow_tracker.initialize()
@@ -930,9 +990,6 @@ Please regenerate addressing ALL of the above feedback.
         # Convert logos to image parts
         logo_parts = [ctx.logo_handler.to_image_part(logo) for logo in logos]
 
-        from datetime import datetime
-        import json
-
         output_dirs = []
         original_run_name = run_info.get("run_name", "unknown")
 
@@ -992,14 +1049,13 @@ Please regenerate addressing ALL of the above feedback.
                 )
                 generation_time = time.time() - start_time
 
-                ctx.mlflow_tracker.log_metrics({"generation_time_seconds": generation_time})
-
                 # Save image with timestamp and params
                 gen_time = datetime.now().strftime("%H%M%S")
                 temp_str = f"t{int(temperature * 10):02d}"
                 image_path = run_dir / f"diagram_{gen_time}_{temp_str}.png"
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
+                image_path.write_bytes(image_bytes)
+                # Start the upload now so it overlaps the metadata write
+                ctx.mlflow_tracker.log_output_image(image_path)
 
                 # Save metadata with matching filename base
                 run_metadata = {
@@ -1018,8 +1074,10 @@ Please regenerate addressing ALL of the above feedback.
                     json.dumps(run_metadata, indent=2)
                 )
 
-                ctx.mlflow_tracker.log_output_image(image_path)
-                ctx.mlflow_tracker.log_metrics({"success": 1})
+                # One log_batch request for both metrics (and the buffered params)
+                ctx.mlflow_tracker.log_metrics(
+                    {"generation_time_seconds": generation_time, "success": 1}
+                )
                 ctx.mlflow_tracker.end_run("FINISHED")
 
                 output_dirs.append(
@@ -1109,8 +1167,7 @@ def refine_prompt(
             refinement = ctx.prompt_refiner.refine_from_run(run_id, feedback)
         elif reference_image and original_prompt:
             console.print(f"Analyzing image: {reference_image}")
-            with open(original_prompt) as f:
-                prompt_text = f.read()
+            prompt_text = original_prompt.read_text(encoding="utf-8")
             refinement = ctx.prompt_refiner.suggest_improvements(
                 reference_image, prompt_text, user_feedback=feedback
             )
@@ -1370,8 +1427,6 @@ def chat(
 
             console.print(f"\n[bold]Found {len(sessions)} saved chat session(s):[/bold]\n")
 
-            from rich.table import Table
-
             table = Table(show_header=True)
             table.add_column("Session", style="cyan")
             table.add_column("Turns", style="magenta", justify="right")
@@ -1899,8 +1954,6 @@ def web(ctx: Context, host: str, port: int, reload: bool, dev: bool):
         console.print(f"  Frontend: http://localhost:{frontend_port}")
         console.print("\n[dim]Press Ctrl+C to stop both servers[/dim]\n")
 
-        from pathlib import Path
-
         frontend_dir = Path(__file__).parent.parent.parent / "frontend"
 
         if not frontend_dir.exists():
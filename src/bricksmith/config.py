@@ -4,7 +4,6 @@ import os
 from pathlib import Path
 from typing import Literal, Optional
 
-import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -111,13 +110,17 @@ class AppConfig(BaseSettings):
         Returns:
             AppConfig instance
         """
-        with open(yaml_path, "r") as f:
-            content = f.read()
+        content = yaml_path.read_text(encoding="utf-8")
 
         # Substitute environment variables
         content = os.path.expandvars(content)
 
-        data = yaml.safe_load(content)
+        # Imported here so commands that never read a config file skip PyYAML
+        import yaml
+
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(content, Loader=loader)
 
         # Parse nested structures
         config_dict = {}
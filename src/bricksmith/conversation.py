@@ -5,12 +5,14 @@ generate -> evaluate -> feedback -> refine loop.
 """
 
 import json
+import re
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -18,7 +20,6 @@ from rich.prompt import IntPrompt, Prompt
 from rich.table import Table
 
 from .config import AppConfig
-from .conversation_dspy import ConversationalRefiner
 from .gemini_client import GeminiClient
 from .image_generator import ImageGenerator
 from .logos import LogoKitHandler
@@ -33,6 +34,9 @@ from .models import (
 from .prompts import PromptBuilder
 from .databricks_style import get_style_prompt
 
+if TYPE_CHECKING:
+    from .conversation_dspy import ConversationalRefiner
+
 # Try to import native MCP client for search functionality
 try:
     from . import mcp_client as native_mcp
@@ -54,6 +58,15 @@ GENERATION_PRESETS = {
 console = Console()
 DEFAULT_BRANDING_FILE = Path("prompts/branding/databricks_default.txt")
 
+# Turns judge criterion keys (e.g. "logo_fidelity") into display labels
+_CRITERION_LABEL_TABLE = str.maketrans("_", " ")
+
+# Outermost {...} block in an LLM response (JSON wrapped in prose/fences)
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
+# Iteration number from saved session files
+_ITERATION_PROMPT_RE = re.compile(r"iteration_(\d+)_prompt\.txt")
+_ITERATION_IMAGE_RE = re.compile(r"iteration_(\d+)\.png")
+
 # Optional readline for input history (UP/DOWN); not available on Windows
 try:
     import readline as _readline  # noqa: F401
@@ -480,13 +493,15 @@ class ConversationChatbot:
         self.mlflow_tracker = MLflowTracker(config.mlflow)
 
         # Initialize DSPy refiner (deferred to allow for lazy loading)
-        self._refiner: Optional[ConversationalRefiner] = None
+        self._refiner: Optional["ConversationalRefiner"] = None
         self._dspy_model = dspy_model
 
         # Session state
         self._session: Optional[ConversationSession] = None
         self._logos: list = []
         self._logo_parts: list = []
+        # Output directories already created this process
+        self._output_dirs: set[Path] = set()
 
         # Reference image state
         self._reference_style: Optional[str] = None
@@ -527,9 +542,12 @@ class ConversationChatbot:
             return ""
 
     @property
-    def refiner(self) -> ConversationalRefiner:
+    def refiner(self) -> "ConversationalRefiner":
         """Lazy-load the DSPy refiner."""
         if self._refiner is None:
+            # dspy is slow to import; only pay for it once refinement is used
+            from .conversation_dspy import ConversationalRefiner
+
             console.print("[dim]Initializing DSPy refiner with Databricks...[/dim]")
             self._refiner = ConversationalRefiner(model=self._dspy_model)
         return self._refiner
@@ -597,8 +615,6 @@ class ConversationChatbot:
         # Create session ID from name or generate random
         if self.conv_config.session_name:
             # Sanitize name for filesystem
-            import re
-
             safe_name = re.sub(r"[^\w\-_]", "_", self.conv_config.session_name)
             session_id = safe_name[:50]  # Limit length
 
@@ -701,22 +717,22 @@ class ConversationChatbot:
                 / datetime.now().strftime("%Y-%m-%d")
                 / f"chat-{self._session.session_id}"
             )
-            output_dir.mkdir(parents=True, exist_ok=True)
+            # Every iteration of a session writes to the same folder
+            if output_dir not in self._output_dirs:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                self._output_dirs.add(output_dir)
 
             # Save prompt (shared across all variants)
             prompt_path = output_dir / f"iteration_{iteration}_prompt.txt"
-            with open(prompt_path, "w") as f:
-                f.write(prompt)
+            prompt_path.write_text(prompt, encoding="utf-8")
 
             # Generate variant(s)
             start_time = time.time()
             variant_paths: list[Path] = []
+            variant_images: list[bytes] = []
 
-            for v in range(num_variants):
-                if num_variants > 1:
-                    console.print(f"  [dim]Generating variant {v + 1}/{num_variants}...[/dim]")
-
-                image_bytes, response_text, metadata = self._image_generator.generate_image(
+            def _generate_variant() -> tuple[bytes, str, dict]:
+                return self._image_generator.generate_image(
                     prompt=prompt,
                     logo_parts=self._logo_parts,
                     temperature=gen_settings.temperature,
@@ -728,17 +744,27 @@ class ConversationChatbot:
                     aspect_ratio=gen_settings.aspect_ratio,
                 )
 
-                # Name variants: iteration_1.png for single, iteration_1_v1.png for multi
-                if num_variants == 1:
-                    image_path = output_dir / f"iteration_{iteration}.png"
-                else:
-                    image_path = output_dir / f"iteration_{iteration}_v{v + 1}.png"
+            # Variants are independent network-bound requests; run them
+            # concurrently and save each in order as it becomes available
+            if num_variants > 1:
+                console.print(f"  [dim]Generating {num_variants} variants concurrently...[/dim]")
+            with ThreadPoolExecutor(max_workers=num_variants) as pool:
+                variants = [pool.submit(_generate_variant) for _ in range(num_variants)]
 
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
+                for v, variant in enumerate(variants):
+                    image_bytes, response_text, metadata = variant.result()
 
-                variant_paths.append(image_path)
-                console.print(f"  [green]Variant {v + 1}:[/green] {image_path}")
+                    # Name variants: iteration_1.png for single, iteration_1_v1.png for multi
+                    if num_variants == 1:
+                        image_path = output_dir / f"iteration_{iteration}.png"
+                    else:
+                        image_path = output_dir / f"iteration_{iteration}_v{v + 1}.png"
+
+                    image_path.write_bytes(image_bytes)
+
+                    variant_paths.append(image_path)
+                    variant_images.append(image_bytes)
+                    console.print(f"  [green]Variant {v + 1}:[/green] {image_path}")
 
             generation_time = time.time() - start_time
 
@@ -770,9 +796,10 @@ class ConversationChatbot:
                     f"[bold green]Selected variant {selected_variant}:[/bold green] {selected_path}"
                 )
 
-                # Copy selected variant as the canonical iteration image
+                # Write selected variant as the canonical iteration image from
+                # memory rather than reading the variant file back
                 canonical_path = output_dir / f"iteration_{iteration}.png"
-                shutil.copy2(selected_path, canonical_path)
+                canonical_path.write_bytes(variant_images[selected_variant - 1])
                 image_path = canonical_path
             else:
                 image_path = variant_paths[0]
@@ -853,9 +880,7 @@ class ConversationChatbot:
                 temperature=0.2,
             )
 
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", result)
+            json_match = _JSON_OBJECT_RE.search(result)
             if json_match:
                 data = json.loads(json_match.group())
                 best = int(data.get("best_variant", 1))
@@ -1065,8 +1090,6 @@ class ConversationChatbot:
         Args:
             new_name: New folder name (will be sanitized; used as chat-<name>).
         """
-        import re
-
         old_dir = self._get_current_output_dir()
         if not old_dir.exists():
             console.print("[yellow]Session folder not found on disk.[/yellow]")
@@ -1335,9 +1358,7 @@ class ConversationChatbot:
             )
 
             # Parse JSON response
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", eval_response)
+            json_match = _JSON_OBJECT_RE.search(eval_response)
             if not json_match:
                 raise ValueError("No JSON found in evaluation response")
 
@@ -1357,7 +1378,7 @@ class ConversationChatbot:
             score_table.add_column("Score", style="magenta", justify="center")
 
             for criterion, score_val in scores.items():
-                label = criterion.replace("_", " ").title()
+                label = criterion.translate(_CRITERION_LABEL_TABLE).title()
                 color = "green" if score_val >= 8 else "yellow" if score_val >= 6 else "red"
                 score_table.add_row(label, f"[{color}]{score_val}/10[/{color}]")
 
@@ -1436,9 +1457,7 @@ class ConversationChatbot:
             )
 
             # Parse JSON response
-            import re
-
-            json_match = re.search(r"\{[\s\S]*\}", eval_response)
+            json_match = _JSON_OBJECT_RE.search(eval_response)
             if not json_match:
                 raise ValueError("No JSON found in evaluation response")
 
@@ -1457,7 +1476,7 @@ class ConversationChatbot:
             score_table.add_column("Score", style="magenta", justify="center")
 
             for criterion, score_val in scores.items():
-                label = criterion.replace("_", " ").title()
+                label = criterion.translate(_CRITERION_LABEL_TABLE).title()
                 color = "green" if score_val >= 8 else "yellow" if score_val >= 6 else "red"
                 score_table.add_row(label, f"[{color}]{score_val}/10[/{color}]")
 
@@ -1959,8 +1978,6 @@ class ConversationChatbot:
         Returns:
             Reconstructed session data dict, or None if no iteration files found
         """
-        import re
-
         if not session_dir.exists() or not session_dir.is_dir():
             return None
 
@@ -1983,12 +2000,12 @@ class ConversationChatbot:
         iteration_nums = set()
 
         for pf in prompt_files:
-            match = re.search(r"iteration_(\d+)_prompt\.txt", pf.name)
+            match = _ITERATION_PROMPT_RE.search(pf.name)
             if match:
                 iteration_nums.add(int(match.group(1)))
 
         for img in image_files:
-            match = re.search(r"iteration_(\d+)\.png", img.name)
+            match = _ITERATION_IMAGE_RE.search(img.name)
             if match:
                 iteration_nums.add(int(match.group(1)))
 
@@ -2175,20 +2192,8 @@ class ConversationChatbot:
             if saved_status == "completed"
             else ConversationStatus(saved_status)
         )
-        chatbot._session = ConversationSession(
-            session_id=session_data["session_id"],
-            initial_prompt=initial_prompt,
-            created_at=session_data.get("created_at", datetime.now().isoformat()),
-            status=status,
-            template_id=session_data.get("template_id"),
-            diagram_spec_path=(
-                Path(session_data["diagram_spec_path"])
-                if session_data.get("diagram_spec_path")
-                else None
-            ),
-        )
-
         # Restore turns, recovering prompt_used from disk if not in session data
+        turns = []
         for turn_data in session_data.get("turns", []):
             prompt_used = turn_data.get("prompt_used", "")
             if not prompt_used:
@@ -2197,20 +2202,38 @@ class ConversationChatbot:
                 if iter_prompt_file.exists():
                     prompt_used = iter_prompt_file.read_text()
 
-            turn = ConversationTurn(
-                iteration=turn_data["iteration"],
-                prompt_used=prompt_used,
-                run_id=turn_data["run_id"],
-                image_path=Path(turn_data["image_path"]),
-                variant_paths=[Path(vp) for vp in turn_data.get("variant_paths", [])],
-                selected_variant=turn_data.get("selected_variant"),
-                generation_time_seconds=turn_data["generation_time_seconds"],
-                score=turn_data.get("score"),
-                feedback=turn_data.get("feedback"),
-                visual_analysis=turn_data.get("visual_analysis"),
-                refinement_reasoning=turn_data.get("refinement_reasoning"),
+            turns.append(
+                {
+                    "iteration": turn_data["iteration"],
+                    "prompt_used": prompt_used,
+                    "run_id": turn_data["run_id"],
+                    "image_path": Path(turn_data["image_path"]),
+                    "variant_paths": [Path(vp) for vp in turn_data.get("variant_paths", [])],
+                    "selected_variant": turn_data.get("selected_variant"),
+                    "generation_time_seconds": turn_data["generation_time_seconds"],
+                    "score": turn_data.get("score"),
+                    "feedback": turn_data.get("feedback"),
+                    "visual_analysis": turn_data.get("visual_analysis"),
+                    "refinement_reasoning": turn_data.get("refinement_reasoning"),
+                }
             )
-            chatbot._session.add_turn(turn)
+
+        # The session file was written by save_session, so skip re-validation
+        chatbot._session = ConversationSession.from_trusted_dict(
+            {
+                "session_id": session_data["session_id"],
+                "initial_prompt": initial_prompt,
+                "created_at": session_data.get("created_at", datetime.now().isoformat()),
+                "status": status,
+                "template_id": session_data.get("template_id"),
+                "diagram_spec_path": (
+                    Path(session_data["diagram_spec_path"])
+                    if session_data.get("diagram_spec_path")
+                    else None
+                ),
+                "turns": turns,
+            }
+        )
 
         num_turns = len(chatbot._session.turns)
         # Resumed sessions have no iteration limit so you can always continue
@@ -4,14 +4,19 @@ NOTE: This uses API key authentication (Google AI Studio) instead of OAuth (Vert
 because gemini-3-pro-image-preview is only available via Google AI Studio.
 """
 
+import logging
 import os
 import time
 import random
+import threading
+from functools import lru_cache
 from typing import Any, Optional, Callable, TypeVar
 
 from google import genai
 from google.genai import types
 
+logger = logging.getLogger(__name__)
+
 T = TypeVar("T")
 
 
@@ -21,7 +26,7 @@ def retry_with_backoff(
     initial_delay: float = 2.0,
     max_delay: float = 60.0,
     backoff_factor: float = 2.0,
-    retryable_errors: tuple = (503, 429, "UNAVAILABLE", "RESOURCE_EXHAUSTED"),
+    retryable_errors: tuple = (503, 429, "UNAVAILABLE", "RESOURCE_EXHAUSTED", "timed out"),
 ) -> T:
     """Retry a function with exponential backoff.
 
@@ -66,6 +71,67 @@ def retry_with_backoff(
     raise last_exception
 
 
+# Per-request timeouts so a stalled call fails (and is retried with backoff)
+# instead of hanging forever. Image generation can legitimately take minutes
+# at 2K/4K, text and vision analysis should not.
+TEXT_REQUEST_TIMEOUT_MS = 120_000
+IMAGE_REQUEST_TIMEOUT_MS = 300_000
+
+# Config pieces that never vary between requests, built once per process
+_TEXT_HTTP_OPTIONS = types.HttpOptions(timeout=TEXT_REQUEST_TIMEOUT_MS)
+_IMAGE_HTTP_OPTIONS = types.HttpOptions(timeout=IMAGE_REQUEST_TIMEOUT_MS)
+_IMAGE_SAFETY_SETTINGS = [
+    types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="OFF"),
+    types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="OFF"),
+]
+
+
+@lru_cache(maxsize=None)
+def _get_genai_client(api_key: str) -> genai.Client:
+    """Get the shared genai client for an API key.
+
+    Each genai.Client owns its own pooled HTTP transport, so sharing one per key
+    lets every GeminiClient reuse keep-alive connections instead of paying a new
+    TCP/TLS handshake per request.
+
+    Args:
+        api_key: Google AI API key
+
+    Returns:
+        Shared genai client
+    """
+    return genai.Client(api_key=api_key)
+
+
+# Logo Parts keyed by (bytes, mime type). The logo handler hands out the same
+# bytes object for a logo every time, and bytes cache their hash, so lookups
+# after the first are cheap.
+_LOGO_PARTS: dict[tuple[bytes, str], types.Part] = {}
+_LOGO_PARTS_MAX = 256
+
+
+def _get_logo_part(data: bytes, mime_type: str) -> types.Part:
+    """Get the genai Part for a logo image, building it once per distinct logo.
+
+    Args:
+        data: Raw image bytes
+        mime_type: Image MIME type
+
+    Returns:
+        Image Part for the request contents
+    """
+    key = (data, mime_type)
+    part = _LOGO_PARTS.get(key)
+    if part is None:
+        if len(_LOGO_PARTS) >= _LOGO_PARTS_MAX:
+            _LOGO_PARTS.clear()
+        part = types.Part.from_bytes(data=data, mime_type=mime_type)
+        _LOGO_PARTS[key] = part
+    return part
+
+
 # Default system instruction for architecture diagram generation
 DEFAULT_ARCHITECTURE_SYSTEM_INSTRUCTION = """
 You are a world-class Solutions Architect for Databricks, specializing in creating professional architecture diagrams for executive presentations and technical documentation.
@@ -160,8 +226,8 @@ class GeminiClient:
                 "environment variable, or pass api_key parameter."
             )
 
-        # Initialize client
-        self.client = genai.Client(api_key=self.api_key)
+        # Share the underlying client (and its connection pool) across instances
+        self.client = _get_genai_client(self.api_key)
         self.model = model or self.DEFAULT_MODEL
 
     def generate_image(
@@ -211,12 +277,7 @@ class GeminiClient:
 
         # Add logo images
         for logo_part in logo_parts:
-            content_parts.append(
-                types.Part.from_bytes(
-                    data=logo_part["data"],
-                    mime_type=logo_part["mime_type"],
-                )
-            )
+            content_parts.append(_get_logo_part(logo_part["data"], logo_part["mime_type"]))
 
         # Add text prompt
         content_parts.append(types.Part.from_text(text=prompt))
@@ -230,16 +291,12 @@ class GeminiClient:
             "top_p": top_p,
             "max_output_tokens": max_output_tokens,
             "response_modalities": ["TEXT", "IMAGE"],
-            "safety_settings": [
-                types.SafetySetting(category="HARM_CATEGORY_HATE_SPEECH", threshold="OFF"),
-                types.SafetySetting(category="HARM_CATEGORY_DANGEROUS_CONTENT", threshold="OFF"),
-                types.SafetySetting(category="HARM_CATEGORY_SEXUALLY_EXPLICIT", threshold="OFF"),
-                types.SafetySetting(category="HARM_CATEGORY_HARASSMENT", threshold="OFF"),
-            ],
+            "safety_settings": _IMAGE_SAFETY_SETTINGS,
             "image_config": types.ImageConfig(
                 aspect_ratio=aspect_ratio,
                 image_size=image_size,
             ),
+            "http_options": _IMAGE_HTTP_OPTIONS,
         }
 
         # Add optional parameters if provided
@@ -330,6 +387,7 @@ class GeminiClient:
         prompt: str,
         temperature: float = 0.2,
         max_output_tokens: int = 2048,
+        response_schema: Optional[type] = None,
     ) -> str:
         """Analyze an image and return text description/analysis.
 
@@ -338,6 +396,8 @@ class GeminiClient:
             prompt: Analysis prompt (what to analyze about the image)
             temperature: Sampling temperature (lower for more factual analysis)
             max_output_tokens: Maximum tokens to generate
+            response_schema: Optional pydantic model; the response is then JSON
+                matching it
 
         Returns:
             Analysis text
@@ -376,6 +436,9 @@ class GeminiClient:
             temperature=temperature,
             max_output_tokens=max_output_tokens,
             response_modalities=["TEXT"],
+            response_mime_type="application/json" if response_schema else None,
+            response_schema=response_schema,
+            http_options=_TEXT_HTTP_OPTIONS,
         )
 
         def _analyze():
@@ -397,6 +460,7 @@ class GeminiClient:
         prompt: str,
         temperature: float = 0.2,
         max_output_tokens: int = 2048,
+        response_schema: Optional[type] = None,
     ) -> str:
         """Analyze multiple images and return comparative analysis.
 
@@ -405,6 +469,8 @@ class GeminiClient:
             prompt: Analysis prompt (what to analyze about the images)
             temperature: Sampling temperature (lower for more factual analysis)
             max_output_tokens: Maximum tokens to generate
+            response_schema: Optional pydantic model; the response is then JSON
+                matching it
 
         Returns:
             Analysis text
@@ -445,6 +511,9 @@ class GeminiClient:
             temperature=temperature,
             max_output_tokens=max_output_tokens,
             response_modalities=["TEXT"],
+            response_mime_type="application/json" if response_schema else None,
+            response_schema=response_schema,
+            http_options=_TEXT_HTTP_OPTIONS,
         )
 
         def _analyze():
@@ -465,6 +534,7 @@ class GeminiClient:
         prompt: str,
         temperature: float = 0.4,
         max_output_tokens: int = 2048,
+        response_schema: Optional[type] = None,
     ) -> str:
         """Generate text response (no images).
 
@@ -472,6 +542,8 @@ class GeminiClient:
             prompt: Text prompt
             temperature: Sampling temperature
             max_output_tokens: Maximum tokens to generate
+            response_schema: Optional pydantic model; the response is then JSON
+                matching it
 
         Returns:
             Generated text
@@ -485,6 +557,9 @@ class GeminiClient:
             temperature=temperature,
             max_output_tokens=max_output_tokens,
             response_modalities=["TEXT"],
+            response_mime_type="application/json" if response_schema else None,
+            response_schema=response_schema,
+            http_options=_TEXT_HTTP_OPTIONS,
         )
 
         def _generate():
@@ -500,6 +575,23 @@ class GeminiClient:
         except Exception as e:
             raise Exception(f"Text generation failed: {e}")
 
+    def warm_up(self) -> None:
+        """Open a connection to the Gemini API in the background.
+
+        Makes a cheap model metadata request through the shared client so the
+        TCP/TLS handshake is done by the time the first generation is sent.
+        Failures are only logged at debug level; the real request will surface
+        any problem.
+        """
+
+        def _warm() -> None:
+            try:
+                self.client.models.get(model=self.model)
+            except Exception as e:
+                logger.debug("Gemini warm-up request for %s failed: %s", self.model, e)
+
+        threading.Thread(target=_warm, name="gemini-warm-up", daemon=True).start()
+
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the model.
 
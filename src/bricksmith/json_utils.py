@@ -0,0 +1,47 @@
+"""JSON serialization helpers for Bricksmith.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with a two-space indent
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Parsed object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
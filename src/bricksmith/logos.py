@@ -2,6 +2,7 @@
 
 import hashlib
 import mimetypes
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
@@ -11,6 +12,20 @@ from PIL import Image
 from .config import LogoKitConfig
 from .models import LogoInfo
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Process-wide caches shared by every LogoKitHandler. Each chatbot/session has
+# its own handler, but they all load the same logo kit files. Both are LRUs,
+# most recently used last, since the web API accepts arbitrary logo dirs.
+# resolved path -> ((mtime_ns, size, max size, extensions), validated LogoInfo).
+# A changed file replaces its path's entry.
+_LOADED_LOGOS: OrderedDict[Path, tuple[tuple, LogoInfo]] = OrderedDict()
+_LOADED_LOGOS_MAX = 512
+# sha256 -> raw file bytes for image parts
+_LOGO_BYTES: OrderedDict[str, bytes] = OrderedDict()
+_LOGO_BYTES_MAX = 64
+
 
 # Logo name to description mapping (for prompt injection)
 # These descriptions are used instead of filenames to prevent filename leakage
@@ -163,6 +178,24 @@ class LogoKitHandler:
         Raises:
             ValueError: If logo is invalid
         """
+        # Reuse the earlier result while the file is unchanged, skipping the
+        # PIL verify and SHA256 pass
+        resolved = None
+        cached = None
+        if file_path.exists():
+            resolved = file_path.resolve()
+            stat = file_path.stat()
+            version = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                self.config.max_logo_size_mb,
+                tuple(self.config.allowed_extensions),
+            )
+            cached = _LOADED_LOGOS.get(resolved)
+            if cached is not None and cached[0] == version:
+                _LOADED_LOGOS.move_to_end(resolved)
+                return cached[1]
+
         # Validate logo
         self.validate_logo(file_path)
 
@@ -184,7 +217,7 @@ class LogoKitHandler:
         # Get size
         size_bytes = file_path.stat().st_size
 
-        return LogoInfo(
+        logo = LogoInfo(
             name=name,
             description=description,
             file_path=file_path,
@@ -192,6 +225,15 @@ class LogoKitHandler:
             content_type=content_type,
             size_bytes=size_bytes,
         )
+        if resolved is not None:
+            if cached is not None and cached[1].sha256_hash != sha256_hash:
+                # The file changed; its old bytes are no longer needed
+                _LOGO_BYTES.pop(cached[1].sha256_hash, None)
+            _LOADED_LOGOS[resolved] = (version, logo)
+            _LOADED_LOGOS.move_to_end(resolved)
+            if len(_LOADED_LOGOS) > _LOADED_LOGOS_MAX:
+                _LOADED_LOGOS.popitem(last=False)
+        return logo
 
     def _get_logo_description(self, name: str) -> str:
         """Get description for a logo name.
@@ -255,9 +297,15 @@ class LogoKitHandler:
         Returns:
             Dictionary in google-genai image part format with raw bytes
         """
-        # Read file as raw bytes (not base64 encoded)
-        with open(logo.file_path, "rb") as f:
-            image_bytes = f.read()
+        # Read file as raw bytes (not base64 encoded), once per distinct logo
+        image_bytes = _LOGO_BYTES.get(logo.sha256_hash)
+        if image_bytes is None:
+            image_bytes = logo.file_path.read_bytes()
+            _LOGO_BYTES[logo.sha256_hash] = image_bytes
+            if len(_LOGO_BYTES) > _LOGO_BYTES_MAX:
+                _LOGO_BYTES.popitem(last=False)
+        else:
+            _LOGO_BYTES.move_to_end(logo.sha256_hash)
 
         # Return in google-genai format (raw bytes, not base64)
         return {
@@ -308,8 +356,10 @@ class LogoKitHandler:
         return sorted(self._logo_cache.keys())
 
     def clear_cache(self) -> None:
-        """Clear logo cache."""
+        """Clear logo cache, including the shared file and image-bytes caches."""
         self._logo_cache.clear()
+        _LOADED_LOGOS.clear()
+        _LOGO_BYTES.clear()
 
     def load_logo_hints(self, logo_dir: Optional[Path] = None) -> dict[str, dict[str, Any]]:
         """Load logo-specific prompt hints from YAML file.
@@ -328,15 +378,14 @@ class LogoKitHandler:
             return {}
 
         try:
-            with open(hints_file, "r") as f:
-                hints = yaml.safe_load(f) or {}
-                # Only return enabled hints
-                self._logo_hints = {
-                    name: hint
-                    for name, hint in hints.items()
-                    if isinstance(hint, dict) and hint.get("enabled", False)
-                }
-                return self._logo_hints
+            hints = yaml.load(hints_file.read_text(), Loader=_YamlLoader) or {}
+            # Only return enabled hints
+            self._logo_hints = {
+                name: hint
+                for name, hint in hints.items()
+                if isinstance(hint, dict) and hint.get("enabled", False)
+            }
+            return self._logo_hints
         except Exception as e:
             print(f"Warning: Failed to load logo hints from {hints_file}: {e}")
             return {}
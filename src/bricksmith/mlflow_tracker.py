@@ -1,16 +1,22 @@
 """MLflow tracking integration for Bricksmith."""
 
 import os
-import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, Param, ViewType
+from mlflow.tracking import MlflowClient
 
+from . import json_utils
 from .config import MLflowConfig
 from .models import EvaluationScores
 
+# Image formats the MLflow UI previews natively; these are uploaded without re-encoding
+_RAW_IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg"})
+
 
 class MLflowTracker:
     """MLflow tracking manager for experiments and runs."""
@@ -24,6 +30,15 @@ class MLflowTracker:
         self.config = config
         self._experiment_id: Optional[str] = None
         self._current_run_id: Optional[str] = None
+        # Parameters buffered until the next log_metrics()/end_run(), so they are
+        # sent to the tracking server in the same log_batch request
+        self._pending_params: dict[str, str] = {}
+        self._client: Optional[MlflowClient] = None
+        # Artifact uploads run in the background and are awaited in end_run()
+        self._artifact_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="mlflow-artifacts"
+        )
+        self._pending_uploads: list[Future] = []
 
     def initialize(self, experiment_name: Optional[str] = None) -> None:
         """Initialize MLflow tracking.
@@ -47,36 +62,47 @@ class MLflowTracker:
 
         # Set tracking URI
         mlflow.set_tracking_uri(self.config.tracking_uri)
+        self._client = MlflowClient(tracking_uri=self.config.tracking_uri)
 
         # Use provided experiment name or fall back to config
         exp_name = experiment_name or self.config.experiment_name
 
-        # Create or get experiment
+        # Create or get experiment and make it active. set_experiment() creates
+        # missing experiments itself, so the explicit lookup is only needed when
+        # a custom artifact location must be applied at creation time.
         try:
-            experiment = mlflow.get_experiment_by_name(exp_name)
-            if experiment is None:
-                self._experiment_id = mlflow.create_experiment(
+            if (
+                self.config.artifact_location
+                and mlflow.get_experiment_by_name(exp_name) is None
+            ):
+                mlflow.create_experiment(
                     exp_name,
                     artifact_location=self.config.artifact_location,
                 )
-            else:
-                self._experiment_id = experiment.experiment_id
+            experiment = mlflow.set_experiment(experiment_name=exp_name)
+            self._experiment_id = experiment.experiment_id
         except Exception as e:
             raise Exception(f"Failed to initialize MLflow experiment: {e}")
 
-        # Set active experiment
-        mlflow.set_experiment(exp_name)
-
     def start_run(
         self,
         run_name: Optional[str] = None,
         tags: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        description: Optional[str] = None,
     ) -> str:
         """Start a new MLflow run.
 
+        Tags and description are sent with the run creation request. Parameters
+        are buffered and flushed together with the first metrics (or at
+        end_run), saving a round trip per run. They are lost if the process
+        exits before either call.
+
         Args:
             run_name: Optional run name
             tags: Optional tags dictionary
+            params: Optional initial parameters
+            description: Optional run description
 
         Returns:
             Run ID
@@ -87,73 +113,183 @@ class MLflowTracker:
         if self._experiment_id is None:
             raise Exception("Experiment not initialized. Call initialize() first.")
 
-        run = mlflow.start_run(run_name=run_name, tags=tags)
+        run = mlflow.start_run(run_name=run_name, tags=tags, description=description)
         self._current_run_id = run.info.run_id
+        self._pending_params = {}
+        if params:
+            self.log_parameters(params)
         return self._current_run_id
 
     def log_parameters(self, params: dict[str, Any]) -> None:
         """Log parameters to current run.
 
+        Parameters are buffered and sent with the next log_metrics() or
+        end_run() call. Outside start_run() they are logged immediately to the
+        fluent API's active run.
+
         Args:
             params: Dictionary of parameters to log
         """
+        converted = {}
         for key, value in params.items():
             # Convert complex types to strings
             if isinstance(value, (dict, list)):
-                value = json.dumps(value)
-            mlflow.log_param(key, value)
+                value = json_utils.dumps(value)
+            converted[key] = str(value)
+
+        if self._current_run_id is None:
+            mlflow.log_params(converted)
+            return
+        self._pending_params.update(converted)
 
     def log_metrics(self, metrics: dict[str, float]) -> None:
         """Log metrics to current run.
 
+        Any buffered parameters are sent in the same request.
+
         Args:
             metrics: Dictionary of metrics to log
         """
-        mlflow.log_metrics(metrics)
+        if not self._pending_params:
+            mlflow.log_metrics(metrics)
+            return
+        timestamp = int(time.time() * 1000)
+        self._log_batch(
+            metrics=[Metric(key, float(value), timestamp, 0) for key, value in metrics.items()]
+        )
+
+    def _log_batch(self, metrics: Optional[list[Metric]] = None) -> None:
+        """Send buffered parameters (and optional metrics) in one request.
 
-    def log_prompt(self, prompt_text: str, filename: str = "prompt.txt") -> None:
+        Args:
+            metrics: Optional metrics to include in the batch
+
+        Raises:
+            Exception: If no run was started with start_run()
+        """
+        if self._current_run_id is None:
+            raise Exception("No active run. Call start_run() first.")
+
+        params = [Param(key, value) for key, value in self._pending_params.items()]
+        self._pending_params = {}
+        self._get_client().log_batch(self._current_run_id, metrics=metrics or [], params=params)
+
+    def _submit_upload(self, upload: Callable[[Optional[str]], None]) -> Future:
+        """Run an artifact upload for the current run in the background.
+
+        Uploads go through the MLflow client with an explicit run ID, since
+        the fluent API's active run is thread-local. Without an active run
+        the upload runs synchronously against the fluent API's run instead.
+
+        Args:
+            upload: Callable taking the run ID (or None) and uploading the artifact
+
+        Returns:
+            Future that completes when the upload is done
+        """
+        run_id = self._current_run_id
+        if run_id is None:
+            future: Future = Future()
+            upload(None)
+            future.set_result(None)
+            return future
+
+        future = self._artifact_pool.submit(upload, run_id)
+        self._pending_uploads.append(future)
+        return future
+
+    def _upload_text(self, text: str, artifact_file: str) -> Future:
+        """Upload a text artifact in the background.
+
+        Args:
+            text: Artifact content
+            artifact_file: Artifact path relative to the run's artifact root
+
+        Returns:
+            Future that completes when the upload is done
+        """
+
+        def upload(run_id: Optional[str]) -> None:
+            if run_id is None:
+                mlflow.log_text(text, artifact_file=artifact_file)
+            else:
+                self._get_client().log_text(run_id, text, artifact_file)
+
+        return self._submit_upload(upload)
+
+    def flush_artifacts(self) -> None:
+        """Wait for all background artifact uploads to finish.
+
+        Raises:
+            Exception: The first upload error, if any upload failed
+        """
+        pending, self._pending_uploads = self._pending_uploads, []
+        wait(pending)
+        for future in pending:
+            error = future.exception()
+            if error is not None:
+                raise error
+
+    def log_prompt(self, prompt_text: str, filename: str = "prompt.txt") -> Future:
         """Log prompt as text artifact.
 
         Args:
             prompt_text: Complete prompt text
             filename: Artifact filename
-        """
-        # Save to temp file and log
-        temp_file = Path(f"/tmp/{self._current_run_id}_{filename}")
-        temp_file.write_text(prompt_text)
-        mlflow.log_artifact(str(temp_file), artifact_path="prompts")
-        temp_file.unlink()  # Clean up
 
+        Returns:
+            Future for the background upload
+        """
+        return self._upload_text(prompt_text, f"prompts/{filename}")
 
     def log_generation_config(
         self, config: dict[str, Any], filename: str = "generation_config.json"
-    ) -> None:
+    ) -> Future:
         """Log generation config as JSON artifact.
 
         Args:
             config: Generation configuration
             filename: Artifact filename
+
+        Returns:
+            Future for the background upload
         """
-        temp_file = Path(f"/tmp/{self._current_run_id}_{filename}")
-        temp_file.write_text(json.dumps(config, indent=2))
-        mlflow.log_artifact(str(temp_file), artifact_path="configs")
-        temp_file.unlink()
+        return self._upload_text(json_utils.dumps(config, indent=True), f"configs/{filename}")
 
-    def log_output_image(self, image_path: Path) -> None:
+    def log_output_image(self, image_path: Path) -> Future:
         """Log generated image for inline preview in MLflow UI.
 
-        Uses mlflow.log_image() for better visualization in the MLflow UI,
-        allowing side-by-side comparison of diagram outputs across runs.
+        PNG and JPEG files are uploaded as-is under ``outputs/`` (the MLflow UI
+        previews them inline), which avoids a full decode and re-encode of the
+        diagram. Other formats are converted via log_image().
 
         Args:
             image_path: Path to image file
+
+        Returns:
+            Future for the background upload
         """
-        from PIL import Image
 
-        # Load image and log with log_image for inline preview
-        img = Image.open(image_path)
-        # Use artifact_path to organize under outputs folder
-        mlflow.log_image(img, artifact_file=f"outputs/{image_path.name}")
+        def upload(run_id: Optional[str]) -> None:
+            if image_path.suffix.lower() in _RAW_IMAGE_SUFFIXES:
+                if run_id is None:
+                    mlflow.log_artifact(str(image_path), artifact_path="outputs")
+                else:
+                    self._get_client().log_artifact(run_id, str(image_path), "outputs")
+                return
+
+            from PIL import Image
+
+            # Load image and log with log_image for inline preview
+            img = Image.open(image_path)
+            # Use artifact_path to organize under outputs folder
+            artifact_file = f"outputs/{image_path.name}"
+            if run_id is None:
+                mlflow.log_image(img, artifact_file=artifact_file)
+            else:
+                self._get_client().log_image(run_id, img, artifact_file=artifact_file)
+
+        return self._submit_upload(upload)
 
     def log_evaluation(self, scores: EvaluationScores) -> None:
         """Log evaluation scores as metrics and artifact.
@@ -169,13 +305,12 @@ class MLflowTracker:
             "constraint_compliance_score": float(scores.constraint_compliance_score),
             "overall_score": scores.overall_score,
         }
-        mlflow.log_metrics(metrics)
+        self.log_metrics(metrics)
 
         # Log full evaluation as JSON artifact
-        temp_file = Path(f"/tmp/{self._current_run_id}_evaluation.json")
-        temp_file.write_text(json.dumps(scores.to_dict(), indent=2))
-        mlflow.log_artifact(str(temp_file), artifact_path="evaluations")
-        temp_file.unlink()
+        self._upload_text(
+            json_utils.dumps(scores.to_dict(), indent=True), "evaluations/evaluation.json"
+        )
 
         # Log notes as tag if present
         if scores.notes:
@@ -184,11 +319,45 @@ class MLflowTracker:
     def end_run(self, status: str = "FINISHED") -> None:
         """End the current run.
 
+        Waits for pending artifact uploads and flushes buffered parameters
+        before the run is closed. A run whose uploads failed is closed as
+        FAILED and the upload error is raised afterwards; calling end_run()
+        again once the run is closed does nothing.
+
         Args:
             status: Run status (FINISHED, FAILED, KILLED)
+
+        Raises:
+            Exception: The first artifact upload error, if any upload failed
+        """
+        if self._current_run_id is None and mlflow.active_run() is None:
+            return
+
+        upload_error: Optional[Exception] = None
+        try:
+            self.flush_artifacts()
+        except Exception as e:
+            upload_error = e
+            if status == "FINISHED":
+                status = "FAILED"
+
+        try:
+            if self._pending_params:
+                self._log_batch()
+        finally:
+            mlflow.end_run(status=status)
+            self._current_run_id = None
+
+        if upload_error is not None:
+            raise upload_error
+
+    def close(self) -> None:
+        """Shut down the background artifact upload threads.
+
+        Waits for any uploads still in flight. The tracker cannot upload
+        artifacts for new runs afterwards.
         """
-        mlflow.end_run(status=status)
-        self._current_run_id = None
+        self._artifact_pool.shutdown(wait=True)
 
     def get_run_info(self, run_id: str) -> dict[str, Any]:
         """Get information about a specific run.
@@ -218,6 +387,7 @@ class MLflowTracker:
         filter_string: Optional[str] = None,
         max_results: int = 100,
         order_by: list[str] = None,
+        include_data: bool = False,
     ) -> list[dict[str, Any]]:
         """List runs in the experiment.
 
@@ -225,6 +395,8 @@ class MLflowTracker:
             filter_string: Optional MLflow filter string
             max_results: Maximum number of runs to return
             order_by: Optional list of order by clauses
+            include_data: Also include params, metrics and tags, flattened as
+                         ``params.<key>``, ``metrics.<key>`` and ``tags.<key>``
 
         Returns:
             List of run dictionaries
@@ -235,16 +407,30 @@ class MLflowTracker:
         if order_by is None:
             order_by = ["start_time DESC"]
 
-        runs = mlflow.search_runs(
-            experiment_ids=[self._experiment_id],
-            filter_string=filter_string,
+        runs = self._get_client().search_runs(
+            [self._experiment_id],
+            filter_string=filter_string or "",
+            run_view_type=ViewType.ACTIVE_ONLY,
             max_results=max_results,
             order_by=order_by,
-            run_view_type=ViewType.ACTIVE_ONLY,
         )
 
-        # Convert DataFrame to list of dicts
-        return runs.to_dict("records") if not runs.empty else []
+        results = []
+        for run in runs:
+            record: dict[str, Any] = {
+                "run_id": run.info.run_id,
+                "run_name": run.info.run_name,
+                "status": run.info.status,
+                "start_time": run.info.start_time,
+                "end_time": run.info.end_time,
+                "artifact_uri": run.info.artifact_uri,
+            }
+            if include_data:
+                record.update({f"params.{k}": v for k, v in run.data.params.items()})
+                record.update({f"metrics.{k}": v for k, v in run.data.metrics.items()})
+                record.update({f"tags.{k}": v for k, v in run.data.tags.items()})
+            results.append(record)
+        return results
 
     def get_artifact_path(self, run_id: str, artifact_path: str) -> str:
         """Get local path to a specific artifact.
@@ -256,10 +442,34 @@ class MLflowTracker:
         Returns:
             Local file path to artifact
         """
-        client = mlflow.tracking.MlflowClient()
-        artifact_uri = client.get_run(run_id).info.artifact_uri
+        artifact_uri = self._get_client().get_run(run_id).info.artifact_uri
         return f"{artifact_uri}/{artifact_path}"
 
+    def download_artifact(self, run_id: str, artifact_path: str) -> Path:
+        """Download a run artifact to a local temporary directory.
+
+        Uses the shared client with an explicit run ID, so it is safe to call
+        from worker threads.
+
+        Args:
+            run_id: MLflow run ID
+            artifact_path: Relative artifact path
+
+        Returns:
+            Local path to the downloaded artifact
+        """
+        return Path(self._get_client().download_artifacts(run_id, artifact_path))
+
+    def _get_client(self) -> MlflowClient:
+        """Get the shared MLflow client, creating it if initialize() was not called.
+
+        Returns:
+            MlflowClient bound to the configured tracking URI
+        """
+        if self._client is None:
+            self._client = MlflowClient(tracking_uri=self.config.tracking_uri)
+        return self._client
+
     @property
     def current_run_id(self) -> Optional[str]:
         """Get current run ID."""
@@ -1,15 +1,21 @@
 """Data models for Bricksmith."""
 
 from enum import Enum
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from . import json_utils
 
 
 class LogoInfo(BaseModel):
     """Information about a single logo."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Human-readable logo name (e.g., 'databricks')")
     description: str = Field(..., description="Description for prompt (e.g., 'red icon')")
     file_path: Path = Field(..., description="Path to logo file")
@@ -21,6 +27,8 @@ class LogoInfo(BaseModel):
 class EvaluationScores(BaseModel):
     """Manual evaluation scores for a generated diagram."""
 
+    model_config = ConfigDict(frozen=True)
+
     logo_fidelity_score: int = Field(..., ge=1, le=10, description="Logo reuse fidelity (1-10)")
     layout_clarity_score: int = Field(..., ge=1, le=10, description="Layout clarity (1-10)")
     text_legibility_score: int = Field(..., ge=1, le=10, description="Text legibility (1-10)")
@@ -28,30 +36,47 @@ class EvaluationScores(BaseModel):
         ..., ge=1, le=10, description="Constraint compliance (1-10)"
     )
     notes: str = Field(default="", description="Evaluation notes")
+    overall_score: float = Field(
+        default=0.0, description="Average score across all dimensions (computed)"
+    )
 
-    @property
-    def overall_score(self) -> float:
-        """Calculate average score across all dimensions.
+    @model_validator(mode="after")
+    def _compute_overall_score(self) -> "EvaluationScores":
+        """Compute the average score once at construction time.
 
-        Returns:
-            Average score (1.0-10.0)
+        Any ``overall_score`` passed in (e.g. from a saved evaluation file) is
+        ignored in favour of the value derived from the dimension scores.
         """
-        return (
-            self.logo_fidelity_score
-            + self.layout_clarity_score
-            + self.text_legibility_score
-            + self.constraint_compliance_score
-        ) / 4.0
+        object.__setattr__(
+            self,
+            "overall_score",
+            (
+                self.logo_fidelity_score
+                + self.layout_clarity_score
+                + self.text_legibility_score
+                + self.constraint_compliance_score
+            )
+            * 0.25,
+        )
+        return self
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary including calculated overall score.
 
+        Built directly from the fields rather than through model_dump(), since
+        this is called on every evaluation that gets logged.
+
         Returns:
             Dictionary with all scores and overall score
         """
-        data = self.model_dump()
-        data["overall_score"] = self.overall_score
-        return data
+        return {
+            "logo_fidelity_score": self.logo_fidelity_score,
+            "layout_clarity_score": self.layout_clarity_score,
+            "text_legibility_score": self.text_legibility_score,
+            "constraint_compliance_score": self.constraint_compliance_score,
+            "notes": self.notes,
+            "overall_score": self.overall_score,
+        }
 
 
 class PromptRefinement(BaseModel):
@@ -72,8 +97,7 @@ class PromptRefinement(BaseModel):
         Args:
             output_path: Path to save template
         """
-        with open(output_path, "w") as f:
-            f.write(self.refined_prompt)
+        output_path.write_text(self.refined_prompt, encoding="utf-8")
 
     def summary(self) -> str:
         """Generate human-readable summary of refinement.
@@ -81,21 +105,47 @@ class PromptRefinement(BaseModel):
         Returns:
             Formatted summary string
         """
-        summary = ["Prompt Refinement Summary", "=" * 50, ""]
+        lines = chain(
+            ("Prompt Refinement Summary", "=" * 50, "", "Key Changes:"),
+            (f"  {i}. {change}" for i, change in enumerate(self.changes, 1)),
+            ("", "Expected Improvements:"),
+            (f"  {i}. {item}" for i, item in enumerate(self.expected_improvements, 1)),
+            ("", f"Confidence: {self.confidence_score:.1%}"),
+        )
+        return "\n".join(lines)
+
 
-        summary.append("Key Changes:")
-        for i, change in enumerate(self.changes, 1):
-            summary.append(f"  {i}. {change}")
+class DiagramAnalysis(BaseModel):
+    """Structured visual analysis of a generated diagram (Gemini JSON output)."""
 
-        summary.append("")
-        summary.append("Expected Improvements:")
-        for i, improvement in enumerate(self.expected_improvements, 1):
-            summary.append(f"  {i}. {improvement}")
+    strengths: list[str] = Field(default_factory=list, description="What worked well")
+    weaknesses: list[str] = Field(default_factory=list, description="What didn't work")
+    observations: str = Field(default="", description="Other observations, incl. what's missing")
 
-        summary.append("")
-        summary.append(f"Confidence: {self.confidence_score:.1%}")
 
-        return "\n".join(summary)
+class PromptImprovement(BaseModel):
+    """Diagram analysis plus refined prompt from a single Gemini vision call."""
+
+    analysis: DiagramAnalysis = Field(..., description="Visual analysis of the diagram")
+    refined_prompt: str = Field(..., description="Refined prompt (full text)")
+    key_changes: list[str] = Field(default_factory=list, description="Key changes made")
+    expected_improvements: list[str] = Field(
+        default_factory=list, description="Expected improvements from changes"
+    )
+
+
+class DiagramComparison(BaseModel):
+    """Structured comparison of a better and a worse diagram (Gemini JSON output)."""
+
+    visual_differences: list[str] = Field(
+        default_factory=list, description="Visual elements that are better in the better diagram"
+    )
+    prompt_differences: list[str] = Field(
+        default_factory=list, description="Prompt elements that likely caused the difference"
+    )
+    recommendations: list[str] = Field(
+        default_factory=list, description="Prompt changes to make the worse diagram match"
+    )
 
 
 # =============================================================================
@@ -130,6 +180,17 @@ class EvaluationPersona(str, Enum):
     AUTO = "auto"
 
 
+# Turn fields included in the JSON history passed to DSPy
+_TURN_HISTORY_KEYS = (
+    "iteration",
+    "score",
+    "feedback",
+    "visual_analysis",
+    "refinement_reasoning",
+)
+_get_turn_history = attrgetter(*_TURN_HISTORY_KEYS)
+
+
 class ConversationTurn(BaseModel):
     """A single turn in the conversation (generate → evaluate → feedback cycle)."""
 
@@ -159,6 +220,10 @@ class ConversationTurn(BaseModel):
 class ConversationSession(BaseModel):
     """A complete conversation session for iterative diagram refinement."""
 
+    # Turns are validated when constructed; appending them to a session must
+    # not re-validate the (growing) turns list
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     session_id: str = Field(..., description="Unique session identifier")
     initial_prompt: str = Field(..., description="The starting prompt")
     turns: list[ConversationTurn] = Field(
@@ -179,11 +244,29 @@ class ConversationSession(BaseModel):
         description="Manual prompt override; cleared when a new turn is added",
     )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ConversationSession":
+        """Rebuild a session from data Bricksmith saved itself, skipping validation.
+
+        Only use this for trusted sources (e.g. session files written by
+        ``save_session``): values must already have their final types
+        (``Path`` for paths, ``ConversationStatus`` for status).
+
+        Args:
+            data: Session fields, with ``turns`` as a list of turn field dicts
+
+        Returns:
+            ConversationSession built with ``model_construct``
+        """
+        turns = [ConversationTurn.model_construct(**t) for t in data.get("turns", [])]
+        return cls.model_construct(**{**data, "turns": turns})
+
     def add_turn(self, turn: ConversationTurn) -> None:
         """Add a turn to the session.
 
         Clears any manual prompt override since the turn captures the
-        prompt that was actually used.
+        prompt that was actually used. The turn is already validated, so it
+        is appended as-is.
 
         Args:
             turn: ConversationTurn to add
@@ -197,20 +280,8 @@ class ConversationSession(BaseModel):
         Returns:
             JSON string of conversation history
         """
-        import json
-
-        history = []
-        for turn in self.turns:
-            history.append(
-                {
-                    "iteration": turn.iteration,
-                    "score": turn.score,
-                    "feedback": turn.feedback,
-                    "visual_analysis": turn.visual_analysis,
-                    "refinement_reasoning": turn.refinement_reasoning,
-                }
-            )
-        return json.dumps(history, indent=2)
+        history = [dict(zip(_TURN_HISTORY_KEYS, _get_turn_history(t))) for t in self.turns]
+        return json_utils.dumps(history, indent=True)
 
     def is_satisfied(self, target_score: int = 10) -> bool:
         """Check if the latest score meets the target.
@@ -223,8 +294,8 @@ class ConversationSession(BaseModel):
         """
         if not self.turns:
             return False
-        latest_turn = self.turns[-1]
-        return latest_turn.score is not None and latest_turn.score >= target_score
+        score = self.turns[-1].score
+        return score is not None and score >= target_score
 
     def get_latest_prompt(self) -> str:
         """Get the most recent prompt used.
@@ -247,10 +318,13 @@ class ConversationSession(BaseModel):
         Returns:
             Best scoring turn or None if no scored turns
         """
-        scored_turns = [t for t in self.turns if t.score is not None]
-        if not scored_turns:
-            return None
-        return max(scored_turns, key=lambda t: t.score)
+        best = None
+        best_score = 0
+        for turn in self.turns:
+            score = turn.score
+            if score is not None and (best is None or score > best_score):
+                best, best_score = turn, score
+        return best
 
 
 class GenerationSettings(BaseModel):
@@ -356,8 +430,23 @@ class ConversationConfig(BaseModel):
 # =============================================================================
 
 
+# Turn fields included in the architect's JSON history
+_ARCHITECT_HISTORY_KEYS = (
+    "turn_number",
+    "user_input",
+    "architect_response",
+    "architecture_snapshot",
+)
+_get_architect_history = attrgetter(*_ARCHITECT_HISTORY_KEYS)
+
+
 class ArchitectTurn(BaseModel):
-    """A single turn in the architect conversation."""
+    """A single turn in the architect conversation.
+
+    Turns are immutable once recorded.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     turn_number: int = Field(..., description="Turn number (1-based)")
     user_input: str = Field(..., description="User's message in this turn")
@@ -371,6 +460,9 @@ class ArchitectTurn(BaseModel):
 class ArchitectSession(BaseModel):
     """A complete architect conversation session."""
 
+    # See ConversationSession: appending turns must not re-validate the list
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     session_id: str = Field(..., description="Unique session identifier")
     initial_problem: str = Field(..., description="The initial problem description")
     turns: list[ArchitectTurn] = Field(
@@ -391,9 +483,27 @@ class ArchitectSession(BaseModel):
         default=ConversationStatus.ACTIVE, description="Session status"
     )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ArchitectSession":
+        """Rebuild a session from data Bricksmith saved itself, skipping validation.
+
+        Only use this for trusted sources (session files or database rows
+        written by Bricksmith): values must already have their final types.
+
+        Args:
+            data: Session fields, with ``turns`` as a list of turn field dicts
+
+        Returns:
+            ArchitectSession built with ``model_construct``
+        """
+        turns = [ArchitectTurn.model_construct(**t) for t in data.get("turns", [])]
+        return cls.model_construct(**{**data, "turns": turns})
+
     def add_turn(self, turn: ArchitectTurn) -> None:
         """Add a turn to the session.
 
+        The turn is already validated, so it is appended as-is.
+
         Args:
             turn: ArchitectTurn to add
         """
@@ -405,19 +515,10 @@ class ArchitectSession(BaseModel):
         Returns:
             JSON string of conversation history
         """
-        import json
-
-        history = []
-        for turn in self.turns:
-            history.append(
-                {
-                    "turn_number": turn.turn_number,
-                    "user_input": turn.user_input,
-                    "architect_response": turn.architect_response,
-                    "architecture_snapshot": turn.architecture_snapshot,
-                }
-            )
-        return json.dumps(history, indent=2)
+        history = [
+            dict(zip(_ARCHITECT_HISTORY_KEYS, _get_architect_history(t))) for t in self.turns
+        ]
+        return json_utils.dumps(history, indent=True)
 
     def get_architecture_json(self) -> str:
         """Get current architecture as JSON.
@@ -425,9 +526,7 @@ class ArchitectSession(BaseModel):
         Returns:
             JSON string of current architecture
         """
-        import json
-
-        return json.dumps(self.current_architecture, indent=2)
+        return json_utils.dumps(self.current_architecture, indent=True)
 
 
 class MCPEnrichmentConfig(BaseModel):
@@ -1,13 +1,21 @@
 """Visual prompt refinement using image analysis."""
 
+import hashlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+from pydantic import ValidationError
 
 from .gemini_client import GeminiClient
 from .mlflow_tracker import MLflowTracker
-from .models import PromptRefinement
+from .models import DiagramAnalysis, DiagramComparison, PromptImprovement, PromptRefinement
 from .prompts import PromptBuilder
 
+# Gemini responses kept per refiner, least recently used evicted first
+_RESPONSE_CACHE_MAX = 128
+
 
 class PromptRefiner:
     """Refines prompts using visual analysis of generated diagrams."""
@@ -28,6 +36,8 @@ class PromptRefiner:
         self.gemini_client = gemini_client
         self.mlflow_tracker = mlflow_tracker
         self.prompt_builder = prompt_builder
+        # Gemini responses keyed by a hash of the exact request inputs
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
 
     def analyze_diagram(
         self,
@@ -51,9 +61,10 @@ class PromptRefiner:
         )
 
         # Use Gemini vision to analyze the image
-        response = self.gemini_client.analyze_image(
-            image_path=image_path,
-            prompt=analysis_prompt,
+        response = self._analyze_image_cached(
+            image_path,
+            analysis_prompt,
+            response_schema=DiagramAnalysis,
         )
 
         return self._parse_analysis_response(response)
@@ -75,19 +86,17 @@ class PromptRefiner:
         Returns:
             PromptRefinement with suggested changes
         """
-        # First, analyze the diagram
-        analysis = self.analyze_diagram(
-            image_path, original_prompt, user_feedback
+        # Analyze the diagram and write the refined prompt in one vision call
+        improvement_prompt = self._build_improvement_prompt(original_prompt, user_feedback)
+        response = self._analyze_image_cached(
+            image_path,
+            improvement_prompt,
+            # Room for the full refined prompt inside the JSON
+            max_output_tokens=8192,
+            response_schema=PromptImprovement,
         )
 
-        # Generate improvement suggestions
-        refinement_prompt = self._build_refinement_prompt(
-            original_prompt, analysis, user_feedback
-        )
-
-        response = self.gemini_client.generate_text(refinement_prompt)
-
-        return self._parse_refinement_response(response, original_prompt, analysis)
+        return self._parse_refinement_response(response, original_prompt)
 
     def refine_from_run(
         self,
@@ -103,16 +112,13 @@ class PromptRefiner:
         Returns:
             PromptRefinement with suggested changes
         """
-        # Load run artifacts from MLflow
-        self.mlflow_tracker.get_run(run_id)
-
         # Download artifacts
-        diagram_path = self.mlflow_tracker.download_artifact(run_id, "diagram.png")
-        prompt_path = self.mlflow_tracker.download_artifact(run_id, "prompt.txt")
+        diagram_path, prompt_path = self._download_artifacts(
+            [(run_id, "diagram.png"), (run_id, "prompt.txt")]
+        )
 
         # Load prompt
-        with open(prompt_path) as f:
-            original_prompt = f.read()
+        original_prompt = Path(prompt_path).read_text(encoding="utf-8")
 
         return self.suggest_improvements(
             diagram_path, original_prompt, user_feedback
@@ -133,16 +139,17 @@ class PromptRefiner:
             Dict with comparative analysis
         """
         # Load both runs
-        good_diagram = self.mlflow_tracker.download_artifact(good_run_id, "diagram.png")
-        bad_diagram = self.mlflow_tracker.download_artifact(bad_run_id, "diagram.png")
-
-        good_prompt_path = self.mlflow_tracker.download_artifact(good_run_id, "prompt.txt")
-        bad_prompt_path = self.mlflow_tracker.download_artifact(bad_run_id, "prompt.txt")
+        good_diagram, bad_diagram, good_prompt_path, bad_prompt_path = self._download_artifacts(
+            [
+                (good_run_id, "diagram.png"),
+                (bad_run_id, "diagram.png"),
+                (good_run_id, "prompt.txt"),
+                (bad_run_id, "prompt.txt"),
+            ]
+        )
 
-        with open(good_prompt_path) as f:
-            good_prompt = f.read()
-        with open(bad_prompt_path) as f:
-            bad_prompt = f.read()
+        good_prompt = Path(good_prompt_path).read_text(encoding="utf-8")
+        bad_prompt = Path(bad_prompt_path).read_text(encoding="utf-8")
 
         # Build comparison prompt
         comparison_prompt = f"""
@@ -164,12 +171,63 @@ class PromptRefiner:
 
         # Use Gemini to analyze both images
         response = self.gemini_client.analyze_images(
-            image_paths=[good_diagram, bad_diagram],
+            image_paths=[str(good_diagram), str(bad_diagram)],
             prompt=comparison_prompt,
+            response_schema=DiagramComparison,
         )
 
         return self._parse_comparison_response(response)
 
+    def _analyze_image_cached(self, image_path: Path, prompt: str, **config: Any) -> str:
+        """Analyze an image with Gemini, reusing the response for identical requests.
+
+        The cache key covers the image bytes, the prompt, the model and the
+        generation options. The image is streamed through the hash so a
+        multi-MB PNG is never held in memory just to build the key.
+
+        Args:
+            image_path: Path to image file
+            prompt: Prompt sent with the image
+            **config: Generation options passed on to GeminiClient.analyze_image
+
+        Returns:
+            Response text
+        """
+        with open(image_path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256")
+        digest.update(prompt.encode())
+        digest.update(self.gemini_client.model.encode())
+        for name, value in sorted(config.items()):
+            if isinstance(value, type):
+                value = value.__qualname__
+            digest.update(f"\0{name}={value!r}".encode())
+        cache_key = digest.hexdigest()
+
+        response = self._response_cache.get(cache_key)
+        if response is not None:
+            self._response_cache.move_to_end(cache_key)
+            return response
+
+        response = self.gemini_client.analyze_image(image_path=image_path, prompt=prompt, **config)
+        self._response_cache[cache_key] = response
+        if len(self._response_cache) > _RESPONSE_CACHE_MAX:
+            self._response_cache.popitem(last=False)
+        return response
+
+    def _download_artifacts(self, artifacts: list[tuple[str, str]]) -> list[Path]:
+        """Download several run artifacts concurrently.
+
+        Args:
+            artifacts: (run_id, artifact_path) pairs
+
+        Returns:
+            Local paths, in the same order as the requested artifacts
+        """
+        with ThreadPoolExecutor(max_workers=len(artifacts)) as pool:
+            return list(
+                pool.map(lambda item: self.mlflow_tracker.download_artifact(*item), artifacts)
+            )
+
     def _build_analysis_prompt(
         self,
         original_prompt: str,
@@ -209,91 +267,73 @@ class PromptRefiner:
 
         return prompt
 
-    def _build_refinement_prompt(
+    def _build_improvement_prompt(
         self,
         original_prompt: str,
-        analysis: dict[str, any],
         user_feedback: Optional[str],
     ) -> str:
-        """Build prompt for generating refinement suggestions."""
-        prompt = f"""
-        Based on this analysis of a generated diagram:
-
-        Strengths: {analysis.get('strengths', [])}
-        Weaknesses: {analysis.get('weaknesses', [])}
-
-        Original prompt:
-        ```
-        {original_prompt}
-        ```
-
-        """
-
-        if user_feedback:
-            prompt += f"User feedback: {user_feedback}\n\n"
+        """Build prompt that analyzes the diagram and refines its prompt in one pass."""
+        prompt = self._build_analysis_prompt(original_prompt, user_feedback)
 
         prompt += """
-        Generate a refined version of the prompt that:
+        Then generate a refined version of the prompt that:
         1. Preserves what worked (the strengths)
         2. Addresses the weaknesses with specific instructions
         3. Is concrete and actionable (avoid vague terms like "better" or "more")
 
         Provide:
+        - Your analysis (strengths, weaknesses, other observations)
         - The refined prompt (full text)
         - Explanation of key changes
         - Expected improvements
-
-        Format as:
-        REFINED PROMPT:
-        [full prompt text]
-
-        KEY CHANGES:
-        - [change 1]
-        - [change 2]
-
-        EXPECTED IMPROVEMENTS:
-        - [improvement 1]
-        - [improvement 2]
         """
 
         return prompt
 
     def _parse_analysis_response(self, response: str) -> dict[str, any]:
-        """Parse Gemini's analysis response into structured data."""
-        # This would parse the response into strengths/weaknesses/observations
-        # Placeholder implementation
+        """Parse Gemini's JSON analysis response into structured data."""
+        try:
+            return DiagramAnalysis.model_validate_json(response).model_dump()
+        except ValidationError:
+            # Model ignored the schema; keep the raw text
+            return self._raw_analysis(response)
+
+    @staticmethod
+    def _raw_analysis(response: str) -> dict[str, Any]:
+        """Wrap a response that did not match the schema as an analysis dict."""
         return {
             "strengths": [],
             "weaknesses": [],
             "observations": response,
         }
 
-    def _parse_refinement_response(
-        self, response: str, original_prompt: str, analysis: dict
-    ) -> PromptRefinement:
-        """Parse refinement response into PromptRefinement object."""
-        # Parse the structured response
-        # Placeholder implementation
-        sections = response.split("REFINED PROMPT:")
-
-        if len(sections) > 1:
-            refined_section = sections[1].split("KEY CHANGES:")[0].strip()
-        else:
-            refined_section = original_prompt
+    def _parse_refinement_response(self, response: str, original_prompt: str) -> PromptRefinement:
+        """Parse Gemini's JSON analysis + refinement response into PromptRefinement."""
+        try:
+            improvement = PromptImprovement.model_validate_json(response)
+        except ValidationError:
+            # Model ignored the schema; keep the original prompt and the raw text
+            return PromptRefinement(
+                original_prompt=original_prompt,
+                refined_prompt=original_prompt,
+                changes=[],
+                expected_improvements=[],
+                analysis=self._raw_analysis(response),
+            )
 
         return PromptRefinement(
             original_prompt=original_prompt,
-            refined_prompt=refined_section,
-            changes=[],
-            expected_improvements=[],
-            analysis=analysis,
+            refined_prompt=improvement.refined_prompt,
+            changes=improvement.key_changes,
+            expected_improvements=improvement.expected_improvements,
+            analysis=improvement.analysis.model_dump(),
         )
 
     def _parse_comparison_response(self, response: str) -> dict[str, any]:
-        """Parse comparison response into structured data."""
-        return {
-            "visual_differences": [],
-            "prompt_differences": [],
-            "recommendations": [],
-            "raw_analysis": response,
-        }
+        """Parse Gemini's JSON comparison response into structured data."""
+        try:
+            comparison = DiagramComparison.model_validate_json(response).model_dump()
+        except ValidationError:
+            comparison = DiagramComparison().model_dump()
+        comparison["raw_analysis"] = response
+        return comparison
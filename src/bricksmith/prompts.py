@@ -1,10 +1,37 @@
 """Prompt building for Bricksmith."""
 
+import re
 from typing import Optional
 
 from .logos import LogoKitHandler
 from .models import LogoInfo
 
+# Filename suffixes that are conventions, not part of the logo identity.
+# These must never leak into the prompt or Gemini will render them as text.
+# Matches any trailing chain of them (e.g. "mlflow-logo-final-black").
+_FILENAME_SUFFIX_RE = re.compile(
+    r"(?:-full|-logo|-solo|-notext|-icon|-wordmark|-black|-final|-white)+$"
+)
+# Turns "delta-lake" / "unity_catalog" style names into space-separated words
+_NAME_SPACES = str.maketrans("-_", "  ")
+
+# Fixed lines framing the per-logo list in the logo kit section
+_LOGO_SECTION_HEADER = (
+    "LOGO KIT (uploaded as image attachments):",
+    "Use these EXACT logos - do NOT recreate or substitute.",
+    "Do NOT add numbered labels or circles to the diagram.",
+    "",
+)
+_LOGO_SECTION_FOOTER = (
+    "",
+    "LOGO RULES:",
+    "- Use EXACT uploaded images - do NOT redraw or recreate",
+    "- Only use logos mentioned in the prompt",
+    "- Do NOT add numbered circles or labels to logos",
+    "- Scale logos uniformly",
+    "- NO filenames in output",
+)
+
 
 class PromptBuilder:
     """Builds prompts with logo constraints for architecture diagram generation."""
@@ -29,46 +56,21 @@ class PromptBuilder:
         Returns:
             Logo section text
         """
-        lines = ["LOGO KIT (uploaded as image attachments):"]
-        lines.append("Use these EXACT logos - do NOT recreate or substitute.")
-        lines.append("Do NOT add numbered labels or circles to the diagram.")
-        lines.append("")
-
-        # Filename suffixes that are conventions, not part of the logo identity.
-        # These must never leak into the prompt or Gemini will render them as text.
-        _FILENAME_SUFFIXES = [
-            "-full", "-logo", "-solo", "-notext", "-icon",
-            "-wordmark", "-black", "-final", "-white",
-        ]
+        lines = list(_LOGO_SECTION_HEADER)
 
         for logo in logo_kit:
             # Strip filename-convention suffixes before building the display name.
-            # Loop to handle chained suffixes (e.g. "mlflow-logo-final-black").
-            clean_name = logo.name
-            changed = True
-            while changed:
-                changed = False
-                for suffix in _FILENAME_SUFFIXES:
-                    if clean_name.endswith(suffix):
-                        clean_name = clean_name[: -len(suffix)]
-                        changed = True
-                        break
-
-            logo_name = clean_name.replace('-', ' ').replace('_', ' ').title()
+            clean_name = _FILENAME_SUFFIX_RE.sub("", logo.name)
+
+            logo_name = clean_name.translate(_NAME_SPACES).title()
             description = logo.description
 
             if description and description != f"{logo.name} logo":
                 lines.append(f"- {logo_name}: {description}")
             else:
                 lines.append(f"- {logo_name}")
-            
-        lines.append("")
-        lines.append("LOGO RULES:")
-        lines.append("- Use EXACT uploaded images - do NOT redraw or recreate")
-        lines.append("- Only use logos mentioned in the prompt")
-        lines.append("- Do NOT add numbered circles or labels to logos")
-        lines.append("- Scale logos uniformly")
-        lines.append("- NO filenames in output")
+
+        lines.extend(_LOGO_SECTION_FOOTER)
 
         return "\n".join(lines)
 
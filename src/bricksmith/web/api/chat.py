@@ -100,8 +100,7 @@ async def get_turns(session_id: str) -> TurnsResponse:
         HTTPException: If session not found
     """
     store = get_session_store()
-    session = await store.get_session(session_id)
-    if session is None:
+    if not await store.session_exists(session_id):
         raise HTTPException(status_code=404, detail="Session not found")
 
     turns_data = await store.get_turns(session_id)
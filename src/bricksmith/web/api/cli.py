@@ -1,6 +1,7 @@
 """API endpoints for mirroring CLI functionality."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from pydantic import TypeAdapter
 
 from .schemas import (
     CLICommandsResponse,
@@ -8,10 +9,13 @@ from .schemas import (
     StartCliJobRequest,
     StartCliJobResponse,
 )
+from .etag import etag_json_response
 from ..services.cli_runner_service import get_cli_runner_service
 
 router = APIRouter()
 
+_JOB_LIST = TypeAdapter(list[CliJobResponse])
+
 
 @router.get("/commands", response_model=CLICommandsResponse)
 async def list_commands() -> CLICommandsResponse:
@@ -37,10 +41,11 @@ async def start_job(request: StartCliJobRequest) -> StartCliJobResponse:
 
 
 @router.get("/jobs", response_model=list[CliJobResponse])
-async def list_jobs() -> list[CliJobResponse]:
-    """List recent CLI jobs."""
+async def list_jobs(request: Request) -> Response:
+    """List recent CLI jobs (304 if unchanged since the client's copy)."""
     service = get_cli_runner_service()
-    return await service.list_jobs()
+    jobs = await service.list_jobs()
+    return etag_json_response(request, _JOB_LIST.dump_json(jobs))
 
 
 @router.get("/jobs/{job_id}", response_model=CliJobResponse)
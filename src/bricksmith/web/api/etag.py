@@ -0,0 +1,28 @@
+"""Conditional GET support for list endpoints the frontend polls."""
+
+import hashlib
+
+from fastapi import Request, Response
+
+
+def etag_json_response(request: Request, body: bytes) -> Response:
+    """Return a JSON body with an ETag, or 304 if the client already has it.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        body: Serialized JSON response body
+
+    Returns:
+        304 Not Modified when the client's cached copy matches, otherwise a
+        200 JSON response carrying the ETag
+    """
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    headers = {"ETag": etag}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+
+    return Response(content=body, media_type="application/json", headers=headers)
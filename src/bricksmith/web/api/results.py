@@ -1,9 +1,12 @@
 """API endpoints for browsing best generated architectures and prompts."""
 
+import asyncio
+import hashlib
 import textwrap
-from typing import Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from .schemas import (
     BestResultItem,
@@ -13,8 +16,12 @@ from .schemas import (
     GenerateFromDocResponse,
     UpdateResultRequest,
 )
+from .etag import etag_json_response
 from ..services.results_service import get_results_service
 
+if TYPE_CHECKING:
+    from ...gemini_client import GeminiClient
+
 router = APIRouter()
 
 
@@ -63,6 +70,60 @@ _DOC_TO_PROMPT_SYSTEM = textwrap.dedent("""
     Output ONLY the prompt text. No preamble, no explanation, no markdown code fences.
 """).strip()
 
+# Invariant start of every document-to-prompt request. Only the document comes
+# after it, so repeat requests share a byte-identical prefix that Gemini's
+# implicit context caching can reuse.
+_DOC_TO_PROMPT_PREFIX = f"""{_DOC_TO_PROMPT_SYSTEM}
+
+---
+
+Convert the following architecture document into a Bricksmith diagram prompt."""
+
+
+# Generated prompts keyed by a hash of model + full request, most recent last.
+# Re-submitting the same document returns the earlier result without a Gemini call.
+_GENERATED_PROMPTS: OrderedDict[str, str] = OrderedDict()
+_GENERATED_PROMPTS_MAX = 256
+# In-flight generations by the same key, so concurrent duplicates wait on one call
+_PENDING_GENERATIONS: dict[str, asyncio.Task[str]] = {}
+
+_doc_prompt_client: Optional["GeminiClient"] = None
+
+
+def _get_doc_prompt_client() -> "GeminiClient":
+    """Return the Gemini client for document conversion, created on first use.
+
+    Reused across requests so client setup happens once per process rather
+    than on every conversion. The API key is read from the environment.
+    """
+    global _doc_prompt_client
+    if _doc_prompt_client is None:
+        from ...gemini_client import GeminiClient
+
+        _doc_prompt_client = GeminiClient()
+    return _doc_prompt_client
+
+
+async def _generate_doc_prompt(client: "GeminiClient", full_prompt: str, cache_key: str) -> str:
+    """Generate a diagram prompt in a worker thread and cache the result.
+
+    Args:
+        client: Gemini client
+        full_prompt: Complete request prompt
+        cache_key: Key for the generated prompt cache
+
+    Returns:
+        Generated prompt text
+    """
+    generated = await asyncio.to_thread(
+        client.generate_text, full_prompt, temperature=0.3, max_output_tokens=4096
+    )
+    generated = generated.strip()
+    _GENERATED_PROMPTS[cache_key] = generated
+    if len(_GENERATED_PROMPTS) > _GENERATED_PROMPTS_MAX:
+        _GENERATED_PROMPTS.popitem(last=False)
+    return generated
+
 
 @router.post("/from-document", response_model=GenerateFromDocResponse)
 async def generate_prompt_from_doc(request: GenerateFromDocRequest) -> GenerateFromDocResponse:
@@ -71,21 +132,13 @@ async def generate_prompt_from_doc(request: GenerateFromDocRequest) -> GenerateF
     Takes any architecture, design, or requirements document and uses Gemini to
     produce a ready-to-use bricksmith diagram prompt in the expected format.
     """
-    from ...gemini_client import GeminiClient
-    from ...config import load_config
-
     try:
-        config = load_config()
-        client = GeminiClient(api_key=config.gemini_api_key or None)
+        client = _get_doc_prompt_client()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to initialise Gemini client: {e}")
 
     filename_hint = f"\nSource file: {request.filename}\n" if request.filename else ""
-    full_prompt = f"""{_DOC_TO_PROMPT_SYSTEM}
-
----
-
-Convert the following architecture document into a Bricksmith diagram prompt.
+    full_prompt = f"""{_DOC_TO_PROMPT_PREFIX}
 {filename_hint}
 ARCHITECTURE DOCUMENT:
 {request.document_text}
@@ -94,22 +147,40 @@ ARCHITECTURE DOCUMENT:
 
 Write the Bricksmith diagram prompt now:"""
 
+    cache_key = hashlib.sha256(f"{client.model}\0{full_prompt}".encode()).hexdigest()
+    generated = _GENERATED_PROMPTS.get(cache_key)
+    if generated is not None:
+        _GENERATED_PROMPTS.move_to_end(cache_key)
+        return GenerateFromDocResponse(prompt=generated)
+
+    # Identical requests already in flight (double submit, retry) share one call
+    task = _PENDING_GENERATIONS.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_doc_prompt(client, full_prompt, cache_key))
+        _PENDING_GENERATIONS[cache_key] = task
+        task.add_done_callback(lambda _: _PENDING_GENERATIONS.pop(cache_key, None))
+
     try:
-        generated = client.generate_text(full_prompt, temperature=0.3, max_output_tokens=4096)
+        # Shielded so one caller disconnecting does not cancel the others
+        generated = await asyncio.shield(task)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Gemini generation failed: {e}")
 
-    return GenerateFromDocResponse(prompt=generated.strip())
+    return GenerateFromDocResponse(prompt=generated)
 
 
 @router.get("/best", response_model=BestResultsResponse)
 async def list_best_results(
+    request: Request,
     limit: int = 30,
     query: Optional[str] = None,
     min_score: Optional[float] = None,
     include_prompt: bool = False,
-) -> BestResultsResponse:
-    """Return ranked architecture outputs with their associated prompts."""
+) -> Response:
+    """Return ranked architecture outputs with their associated prompts.
+
+    Responds 304 when the results are unchanged since the client's copy.
+    """
     service = get_results_service()
     results = service.list_best_results(
         limit=limit,
@@ -117,7 +188,8 @@ async def list_best_results(
         min_score=min_score,
         include_prompt=include_prompt,
     )
-    return BestResultsResponse(results=results, total=len(results))
+    payload = BestResultsResponse(results=results, total=len(results))
+    return etag_json_response(request, payload.model_dump_json().encode())
 
 
 @router.patch("/{result_id:path}", response_model=BestResultItem)
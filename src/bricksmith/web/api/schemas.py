@@ -2,7 +2,7 @@
 
 from typing import Any, Optional, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 
 # Component and Connection schemas (mirrors models.py)
@@ -27,6 +27,11 @@ class ConnectionSchema(BaseModel):
     style: str = Field(default="solid", description="Line style: solid, dashed, dotted")
 
 
+# Built once at import; validate a whole list in one call instead of per item
+ComponentListAdapter = TypeAdapter(list[ComponentSchema])
+ConnectionListAdapter = TypeAdapter(list[ConnectionSchema])
+
+
 class ArchitectureState(BaseModel):
     """Current state of the architecture being designed."""
 
@@ -422,10 +427,19 @@ class GenerationSettingsRequest(BaseModel):
     preset: Optional[str] = Field(
         None, description="Preset: deterministic, conservative, balanced, creative, wild"
     )
-    image_size: Optional[str] = Field(None, description="1K, 2K, or 4K")
+    image_size: Optional[Literal["1K", "2K", "4K"]] = Field(None, description="1K, 2K, or 4K")
     aspect_ratio: Optional[str] = Field(None, description="16:9, 1:1, 4:3, 9:16, 3:4, 21:9")
     num_variants: Optional[int] = Field(None, ge=1, le=8)
 
+    @field_validator("image_size", mode="before")
+    @classmethod
+    def _normalize_image_size(cls, value: Any) -> Any:
+        """Accept sizes in any case ("2k"), as the chat settings parser does."""
+        if isinstance(value, str):
+            value = value.strip().upper()
+            return value or None
+        return value
+
     def to_generation_kwargs(self) -> dict[str, Any]:
         """Resolve preset + overrides into kwargs for generate_image()."""
         from ...conversation import GENERATION_PRESETS
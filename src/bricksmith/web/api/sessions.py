@@ -1,12 +1,13 @@
 """Session CRUD API endpoints."""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
 from .schemas import (
     CreateSessionRequest,
     SessionResponse,
     SessionListResponse,
 )
+from .etag import etag_json_response
 from ..services.architect_service import get_architect_service
 
 router = APIRouter()
@@ -43,21 +44,24 @@ async def create_session(request: CreateSessionRequest) -> SessionResponse:
 
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
+    request: Request,
     limit: int = 50,
     offset: int = 0,
-) -> SessionListResponse:
+) -> Response:
     """List all sessions with pagination.
 
     Args:
+        request: Incoming request, for If-None-Match
         limit: Maximum number of sessions to return
         offset: Number of sessions to skip
 
     Returns:
-        List of sessions and total count
+        List of sessions and total count (304 if unchanged since the client's copy)
     """
     service = get_architect_service()
     sessions, total = await service.list_sessions(limit=limit, offset=offset)
-    return SessionListResponse(sessions=sessions, total=total)
+    payload = SessionListResponse(sessions=sessions, total=total)
+    return etag_json_response(request, payload.model_dump_json().encode())
 
 
 @router.get("/{session_id}", response_model=SessionResponse)
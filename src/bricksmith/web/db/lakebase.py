@@ -98,9 +98,14 @@ class LakebaseSessionStore(SessionStore):
                 )
             """)
 
-            # Create index for faster lookups
+            # UNIQUE(session_id, turn_number) already indexes turns by session in
+            # turn order; drop the separate session_id index older databases carry
+            cursor.execute("DROP INDEX IF EXISTS idx_turns_session_id")
+
+            # Lets list_sessions walk sessions newest-first and stop at the page
+            # limit, so turn counts are only computed for the returned rows
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_turns_session_id ON turns(session_id)
+                CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at)
             """)
 
             # Migration: add reference_prompt column if missing
@@ -204,6 +209,17 @@ class LakebaseSessionStore(SessionStore):
         finally:
             self._put_connection(conn)
 
+    async def session_exists(self, session_id: str) -> bool:
+        """Check whether a session exists without loading its architecture."""
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+
+            cursor.execute("SELECT 1 FROM sessions WHERE session_id = %s", (session_id,))
+            return cursor.fetchone() is not None
+        finally:
+            self._put_connection(conn)
+
     async def list_sessions(
         self,
         limit: int = 50,
@@ -218,10 +234,11 @@ class LakebaseSessionStore(SessionStore):
             cursor.execute("SELECT COUNT(*) FROM sessions")
             total = cursor.fetchone()[0]
 
-            # Get sessions with turn counts
+            # Get sessions with turn counts. The architecture blob is left out:
+            # it can be large and the list view only shows summaries
             cursor.execute(
                 """
-                SELECT s.*,
+                SELECT s.session_id, s.initial_problem, s.status, s.created_at,
                        (SELECT COUNT(*) FROM turns t WHERE t.session_id = s.session_id) as turn_count
                 FROM sessions s
                 ORDER BY s.created_at DESC
@@ -236,8 +253,6 @@ class LakebaseSessionStore(SessionStore):
             for row in rows:
                 row_dict = dict(zip(columns, row))
 
-                architecture = self._parse_architecture(row_dict["current_architecture"])
-
                 sessions.append(
                     SessionResponse(
                         session_id=row_dict["session_id"],
@@ -247,7 +262,6 @@ class LakebaseSessionStore(SessionStore):
                             row_dict["created_at"].isoformat() if row_dict["created_at"] else ""
                         ),
                         turn_count=row_dict["turn_count"],
-                        current_architecture=architecture,
                     )
                 )
 
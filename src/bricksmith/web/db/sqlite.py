@@ -1,16 +1,96 @@
 """SQLite implementation of the session store."""
 
+import asyncio
+import functools
 import json
 import sqlite3
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Concatenate,
+    Coroutine,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
 
 from pydantic import ValidationError
 
+from ... import json_utils
 from ..api.schemas import SessionResponse, ArchitectureState
 from ..services.session_store import SessionStore
 
+# Current UTC time in the ISO-8601 form session timestamps are stored in,
+# computed by SQLite rather than bound from Python
+_NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# update_session statements for each combination of updated columns. Fixed SQL
+# strings hit sqlite3's per-connection statement cache instead of being
+# re-prepared for every call. RETURNING hands back the updated row so the
+# response does not need another SELECT (requires SQLite 3.35+).
+_UPDATE_SESSION_RETURNING = (
+    " RETURNING session_id, initial_problem, status, created_at, current_architecture"
+)
+_UPDATE_SESSION_SQL = {
+    (True, False): (
+        f"UPDATE sessions SET current_architecture = ?, updated_at = {_NOW_SQL}"
+        " WHERE session_id = ?" + _UPDATE_SESSION_RETURNING
+    ),
+    (False, True): (
+        f"UPDATE sessions SET status = ?, updated_at = {_NOW_SQL}"
+        " WHERE session_id = ?" + _UPDATE_SESSION_RETURNING
+    ),
+    (True, True): (
+        f"UPDATE sessions SET current_architecture = ?, status = ?, updated_at = {_NOW_SQL}"
+        " WHERE session_id = ?" + _UPDATE_SESSION_RETURNING
+    ),
+}
+
+# A duplicate (session_id, turn_number) is skipped rather than raising, so
+# add_turn reports it through rowcount without building an exception
+_INSERT_TURN_SQL = (
+    "INSERT OR IGNORE INTO turns"
+    " (session_id, turn_number, user_input, architect_response, architecture_snapshot)"
+    " VALUES (?, ?, ?, ?, ?)"
+)
+
+# Sessions kept in the get_session cache, least recently used evicted first
+_SESSION_CACHE_SIZE = 1024
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _off_loop(
+    method: Callable[Concatenate["SQLiteSessionStore", _P], _R],
+) -> Callable[Concatenate["SQLiteSessionStore", _P], Coroutine[Any, Any, _R]]:
+    """Run a blocking store method on the store's database thread.
+
+    Calls from the task holding an open transaction() run directly; every
+    other caller waits for the store lock, so it queues behind the
+    transaction instead of joining it.
+
+    Args:
+        method: Synchronous method that uses the SQLite connection
+
+    Returns:
+        Coroutine method that awaits it without blocking the event loop
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "SQLiteSessionStore", *args: _P.args, **kwargs: _P.kwargs) -> _R:
+        if self._transaction_task is not None and self._transaction_task is asyncio.current_task():
+            return await self._run(method, self, *args, **kwargs)
+        async with self._lock:
+            return await self._run(method, self, *args, **kwargs)
+
+    return wrapper
+
 
 class SQLiteSessionStore(SessionStore):
     """SQLite-based session storage for local development."""
@@ -29,14 +109,84 @@ class SQLiteSessionStore(SessionStore):
 
         self.db_path = db_path
         self._conn: Optional[sqlite3.Connection] = None
+        # Held by each store call, and by a transaction() block for its whole
+        # duration. The task that owns the open transaction and its nesting
+        # depth; writes only commit at depth 0.
+        self._lock = asyncio.Lock()
+        self._transaction_task: Optional[asyncio.Task] = None
+        self._transaction_depth = 0
+        # get_session results by session_id. Every write through this store
+        # refreshes or drops the entry, so hits are served without SQL; this
+        # assumes the store's process is the only writer to the database.
+        self._session_cache: OrderedDict[str, SessionResponse] = OrderedDict()
+        # sqlite3 calls block, so they run here instead of on the event loop.
+        # A single worker keeps every statement on the one connection serialized.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-store")
+
+    async def _run(self, func: Callable[..., _R], *args, **kwargs) -> _R:
+        """Run a blocking call on the database thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get or create database connection."""
         if self._conn is None:
             self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
             self._conn.row_factory = sqlite3.Row
+            # WAL + synchronous=NORMAL: commits append to the log without an
+            # fsync each, and readers don't block the writer
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA mmap_size=268435456")
+            self._conn.execute("PRAGMA cache_size=-65536")
+            # Enforce the schema's ON DELETE CASCADE
+            self._conn.execute("PRAGMA foreign_keys=ON")
         return self._conn
 
+    def _commit(self) -> None:
+        """Commit pending writes unless a transaction() block will commit them."""
+        if self._transaction_depth == 0:
+            self._get_connection().commit()
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Commit all writes made inside the block together (rolled back on error).
+
+        The transaction belongs to the task that opens it. Store calls from
+        other tasks, including tasks started inside the block, wait until it
+        has committed or rolled back, so their writes are never committed or
+        discarded with it. Nested blocks in the owning task join the outer
+        transaction.
+        """
+        task = asyncio.current_task()
+        if self._transaction_task is not None and self._transaction_task is task:
+            self._transaction_depth += 1
+            try:
+                yield
+            finally:
+                self._transaction_depth -= 1
+            return
+
+        async with self._lock:
+            self._transaction_task = task
+            self._transaction_depth = 1
+            try:
+                yield
+            except BaseException:
+                await self._run(self._rollback)
+                raise
+            else:
+                await self._run(self._get_connection().commit)
+            finally:
+                self._transaction_task = None
+                self._transaction_depth = 0
+
+    def _rollback(self) -> None:
+        """Discard uncommitted writes and any cached reads of them."""
+        self._get_connection().rollback()
+        self._session_cache.clear()
+
     def _parse_architecture(self, raw_architecture: Optional[str]) -> Optional[ArchitectureState]:
         """Parse persisted architecture JSON defensively.
 
@@ -46,12 +196,13 @@ class SQLiteSessionStore(SessionStore):
         if not raw_architecture:
             return None
         try:
-            arch_data = json.loads(raw_architecture)
+            arch_data = json_utils.loads(raw_architecture)
             return ArchitectureState(**arch_data)
         except (json.JSONDecodeError, ValidationError, TypeError, ValueError):
             return None
 
-    async def initialize(self) -> None:
+    @_off_loop
+    def initialize(self) -> None:
         """Create database tables if they don't exist."""
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -85,9 +236,14 @@ class SQLiteSessionStore(SessionStore):
             )
         """)
 
-        # Create index for faster lookups
+        # UNIQUE(session_id, turn_number) already indexes turns by session in
+        # turn order; drop the separate session_id index older databases carry
+        cursor.execute("DROP INDEX IF EXISTS idx_turns_session_id")
+
+        # Lets list_sessions walk sessions newest-first and stop at the page
+        # limit, so turn counts are only computed for the returned rows
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_turns_session_id ON turns(session_id)
+            CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON sessions(created_at)
         """)
 
         # Migration: add reference_prompt column if missing
@@ -98,13 +254,15 @@ class SQLiteSessionStore(SessionStore):
 
         conn.commit()
 
-    async def close(self) -> None:
+    @_off_loop
+    def close(self) -> None:
         """Close database connection."""
         if self._conn is not None:
             self._conn.close()
             self._conn = None
 
-    async def create_session(
+    @_off_loop
+    def create_session(
         self,
         session_id: str,
         initial_problem: str,
@@ -116,29 +274,47 @@ class SQLiteSessionStore(SessionStore):
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        now = datetime.utcnow().isoformat()
-        logos_json = json.dumps(available_logos) if available_logos else None
+        logos_json = json_utils.dumps(available_logos) if available_logos else None
 
         cursor.execute(
-            """
+            f"""
             INSERT INTO sessions (session_id, initial_problem, custom_context, available_logos, reference_prompt, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, ?, ?, {_NOW_SQL}, {_NOW_SQL})
+            RETURNING created_at
             """,
-            (session_id, initial_problem, custom_context, logos_json, reference_prompt, now, now),
+            (session_id, initial_problem, custom_context, logos_json, reference_prompt),
         )
-        conn.commit()
+        row = cursor.fetchone()
+        self._commit()
 
-        return SessionResponse(
+        session = SessionResponse(
             session_id=session_id,
             initial_problem=initial_problem,
             status="active",
-            created_at=now,
+            created_at=row["created_at"],
             turn_count=0,
             current_architecture=None,
         )
+        # Write through so the first get_session is already a cache hit
+        self._remember_session(session)
+        return session
 
-    async def get_session(self, session_id: str) -> Optional[SessionResponse]:
+    @_off_loop
+    def get_session(self, session_id: str) -> Optional[SessionResponse]:
         """Get a session by ID."""
+        return self._load_session(session_id)
+
+    def _load_session(self, session_id: str) -> Optional[SessionResponse]:
+        """Read a session, or None if it does not exist.
+
+        Cached sessions are returned without touching the database. Callers
+        get their own copy, so changing it does not alter the cache.
+        """
+        cached = self._session_cache.get(session_id)
+        if cached is not None:
+            self._session_cache.move_to_end(session_id)
+            return cached.model_copy(deep=True)
+
         conn = self._get_connection()
         cursor = conn.cursor()
 
@@ -151,6 +327,20 @@ class SQLiteSessionStore(SessionStore):
         if row is None:
             return None
 
+        return self._cache_session(row)
+
+    def _cache_session(self, row: sqlite3.Row) -> SessionResponse:
+        """Build a SessionResponse from a sessions row and cache it.
+
+        Args:
+            row: Row with the session columns and current_architecture
+
+        Returns:
+            The session, including its turn count
+        """
+        session_id = row["session_id"]
+        cursor = self._get_connection().cursor()
+
         # Get turn count
         cursor.execute(
             "SELECT COUNT(*) as count FROM turns WHERE session_id = ?",
@@ -161,16 +351,38 @@ class SQLiteSessionStore(SessionStore):
         # Parse architecture
         architecture = self._parse_architecture(row["current_architecture"])
 
-        return SessionResponse(
-            session_id=row["session_id"],
+        session = SessionResponse(
+            session_id=session_id,
             initial_problem=row["initial_problem"],
             status=row["status"],
             created_at=row["created_at"],
             turn_count=turn_count,
             current_architecture=architecture,
         )
+        self._remember_session(session)
+        return session
+
+    def _remember_session(self, session: SessionResponse) -> None:
+        """Cache a copy of a session, evicting the least recently used."""
+        self._session_cache[session.session_id] = session.model_copy(deep=True)
+        self._session_cache.move_to_end(session.session_id)
+        if len(self._session_cache) > _SESSION_CACHE_SIZE:
+            self._session_cache.popitem(last=False)
+
+    @_off_loop
+    def session_exists(self, session_id: str) -> bool:
+        """Check whether a session exists without loading its architecture."""
+        if session_id in self._session_cache:
+            return True
 
-    async def list_sessions(
+        conn = self._get_connection()
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT 1 FROM sessions WHERE session_id = ?", (session_id,))
+        return cursor.fetchone() is not None
+
+    @_off_loop
+    def list_sessions(
         self,
         limit: int = 50,
         offset: int = 0,
@@ -183,10 +395,11 @@ class SQLiteSessionStore(SessionStore):
         cursor.execute("SELECT COUNT(*) as count FROM sessions")
         total = cursor.fetchone()["count"]
 
-        # Get sessions
+        # Get sessions. The architecture blob is left out: it can be large and
+        # the list view only shows summaries (get_session returns it in full)
         cursor.execute(
             """
-            SELECT s.*,
+            SELECT s.session_id, s.initial_problem, s.status, s.created_at,
                    (SELECT COUNT(*) FROM turns t WHERE t.session_id = s.session_id) as turn_count
             FROM sessions s
             ORDER BY s.created_at DESC
@@ -198,8 +411,6 @@ class SQLiteSessionStore(SessionStore):
 
         sessions = []
         for row in rows:
-            architecture = self._parse_architecture(row["current_architecture"])
-
             sessions.append(
                 SessionResponse(
                     session_id=row["session_id"],
@@ -207,13 +418,13 @@ class SQLiteSessionStore(SessionStore):
                     status=row["status"],
                     created_at=row["created_at"],
                     turn_count=row["turn_count"],
-                    current_architecture=architecture,
                 )
             )
 
         return sessions, total
 
-    async def delete_session(self, session_id: str) -> bool:
+    @_off_loop
+    def delete_session(self, session_id: str) -> bool:
         """Delete a session by ID."""
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -223,11 +434,13 @@ class SQLiteSessionStore(SessionStore):
 
         # Delete session
         cursor.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
-        conn.commit()
+        self._commit()
+        self._session_cache.pop(session_id, None)
 
         return cursor.rowcount > 0
 
-    async def update_session(
+    @_off_loop
+    def update_session(
         self,
         session_id: str,
         architecture: Optional[dict] = None,
@@ -237,33 +450,31 @@ class SQLiteSessionStore(SessionStore):
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        updates = []
-        params = []
+        if architecture is None and status is None:
+            return self._load_session(session_id)
 
+        params = []
         if architecture is not None:
-            updates.append("current_architecture = ?")
-            params.append(json.dumps(architecture))
-
+            params.append(json_utils.dumps(architecture))
         if status is not None:
-            updates.append("status = ?")
             params.append(status)
-
-        if not updates:
-            return await self.get_session(session_id)
-
-        updates.append("updated_at = ?")
-        params.append(datetime.utcnow().isoformat())
         params.append(session_id)
 
         cursor.execute(
-            f"UPDATE sessions SET {', '.join(updates)} WHERE session_id = ?",
+            _UPDATE_SESSION_SQL[(architecture is not None, status is not None)],
             params,
         )
-        conn.commit()
+        # Fetch the RETURNING row before committing so the statement is complete
+        row = cursor.fetchone()
+        self._commit()
 
-        return await self.get_session(session_id)
+        if row is None:
+            self._session_cache.pop(session_id, None)
+            return None
+        return self._cache_session(row)
 
-    async def add_turn(
+    @_off_loop
+    def add_turn(
         self,
         session_id: str,
         turn_number: int,
@@ -275,22 +486,31 @@ class SQLiteSessionStore(SessionStore):
         conn = self._get_connection()
         cursor = conn.cursor()
 
-        snapshot_json = json.dumps(architecture_snapshot) if architecture_snapshot else None
+        snapshot_json = json_utils.dumps(architecture_snapshot) if architecture_snapshot else None
 
         try:
             cursor.execute(
-                """
-                INSERT INTO turns (session_id, turn_number, user_input, architect_response, architecture_snapshot)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _INSERT_TURN_SQL,
                 (session_id, turn_number, user_input, architect_response, snapshot_json),
             )
-            conn.commit()
-            return True
+            inserted = cursor.rowcount > 0
         except sqlite3.IntegrityError:
+            # Unknown session_id (foreign key)
+            inserted = False
+        if not inserted:
+            # Close the transaction the statement opened, unless a
+            # transaction() block owns it
+            if self._transaction_depth == 0:
+                conn.rollback()
             return False
 
-    async def get_turns(self, session_id: str) -> list[dict]:
+        self._commit()
+        # The cached turn_count is now stale
+        self._session_cache.pop(session_id, None)
+        return True
+
+    @_off_loop
+    def get_turns(self, session_id: str) -> list[dict]:
         """Get all turns for a session."""
         conn = self._get_connection()
         cursor = conn.cursor()
@@ -310,7 +530,7 @@ class SQLiteSessionStore(SessionStore):
         for row in rows:
             snapshot = None
             if row["architecture_snapshot"]:
-                snapshot = json.loads(row["architecture_snapshot"])
+                snapshot = json_utils.loads(row["architecture_snapshot"])
 
             turns.append(
                 {
@@ -324,13 +544,31 @@ class SQLiteSessionStore(SessionStore):
 
         return turns
 
-    async def get_full_session_data(self, session_id: str) -> Optional[dict]:
-        """Get complete session data including turns and architecture."""
+    @_off_loop
+    def get_full_session_data(self, session_id: str) -> Optional[dict]:
+        """Get complete session data including turns and architecture.
+
+        Turns are aggregated into a JSON array by SQLite so the session and its
+        history come back in a single query.
+        """
         conn = self._get_connection()
         cursor = conn.cursor()
 
         cursor.execute(
-            "SELECT * FROM sessions WHERE session_id = ?",
+            """
+            SELECT s.*,
+                   (SELECT json_group_array(json_object(
+                               'turn_number', t.turn_number,
+                               'user_input', t.user_input,
+                               'architect_response', t.architect_response,
+                               'architecture_snapshot', json(t.architecture_snapshot),
+                               'created_at', t.created_at))
+                    FROM (SELECT * FROM turns
+                          WHERE session_id = s.session_id
+                          ORDER BY turn_number) t) AS turns_json
+            FROM sessions s
+            WHERE s.session_id = ?
+            """,
             (session_id,),
         )
         row = cursor.fetchone()
@@ -338,16 +576,16 @@ class SQLiteSessionStore(SessionStore):
         if row is None:
             return None
 
-        turns = await self.get_turns(session_id)
+        turns = json_utils.loads(row["turns_json"])
 
         # Parse JSON fields
         architecture = None
         if row["current_architecture"]:
-            architecture = json.loads(row["current_architecture"])
+            architecture = json_utils.loads(row["current_architecture"])
 
         available_logos = None
         if row["available_logos"]:
-            available_logos = json.loads(row["available_logos"])
+            available_logos = json_utils.loads(row["available_logos"])
 
         # Safely access reference_prompt (may not exist in old databases)
         try:
@@ -1,9 +1,11 @@
 """Service layer wrapping ArchitectChatbot for web use."""
 
+import asyncio
 import base64
 import logging
 import tempfile
 import uuid
+import weakref
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Literal
@@ -14,13 +16,13 @@ from ...gemini_client import GeminiClient
 from ...image_generator import ImageGenerator
 from ...mcp_config import MCPEnrichmentConfig
 from ...mcp_context_enricher import MCPContextEnricher
-from ...models import ArchitectConfig, ArchitectSession, ArchitectTurn, ConversationStatus
+from ...models import ArchitectConfig, ArchitectSession, ConversationStatus
 from ...databricks_image_client import DatabricksImageClient
 from ...openai_image_client import OpenAIImageClient
 from ..api.schemas import (
     ArchitectureState,
-    ComponentSchema,
-    ConnectionSchema,
+    ComponentListAdapter,
+    ConnectionListAdapter,
     GenerationSettingsRequest,
     MCPEnrichmentOptions,
     MessageResponse,
@@ -49,6 +51,19 @@ class ArchitectService:
         self._session_image_generators: dict[str, ImageGenerator] = {}
         self._session_provider_overrides: dict[str, Literal["gemini", "openai", "databricks"]] = {}
         self._session_mcp_config: dict[str, MCPEnrichmentOptions] = {}
+        # Serializes requests that drive the same cached chatbot. Weak values:
+        # a lock goes away once no request holds or waits for it.
+        self._session_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        """Lock held while a request runs and persists a session's chatbot turn."""
+        lock = self._session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._session_locks[session_id] = lock
+        return lock
 
     @property
     def config(self) -> AppConfig:
@@ -187,7 +202,7 @@ class ArchitectService:
                     tmp.write(image_data)
                     tmp_path = Path(tmp.name)
                 try:
-                    chatbot.analyze_reference_image(tmp_path)
+                    await asyncio.to_thread(chatbot.analyze_reference_image, tmp_path)
                     logger.info(
                         "Reference image analyzed for session %s (%d chars)",
                         session_id,
@@ -326,30 +341,29 @@ class ArchitectService:
             except Exception as e:
                 logger.warning("Failed to restore MCP enricher: %s", e)
 
-        # Restore session
-        chatbot._session = ArchitectSession(
-            session_id=session_id,
-            initial_problem=session_data["initial_problem"],
-            available_logos=available_logos,
-            custom_context=session_data.get("custom_context"),
-            created_at=session_data["created_at"],
-            status=ConversationStatus(session_data.get("status", "active")),
-        )
-
-        # Restore architecture
+        # Restore session, architecture and turns. The rows were written by
+        # this service, so skip re-validation.
+        session_fields = {
+            "session_id": session_id,
+            "initial_problem": session_data["initial_problem"],
+            "available_logos": available_logos,
+            "custom_context": session_data.get("custom_context"),
+            "created_at": session_data["created_at"],
+            "status": ConversationStatus(session_data.get("status", "active")),
+            "turns": [
+                {
+                    "turn_number": turn_data["turn_number"],
+                    "user_input": turn_data["user_input"],
+                    "architect_response": turn_data["architect_response"],
+                    "architecture_snapshot": turn_data.get("architecture_snapshot", {}),
+                    "timestamp": turn_data.get("created_at", datetime.now().isoformat()),
+                }
+                for turn_data in session_data.get("turns", [])
+            ],
+        }
         if session_data.get("current_architecture"):
-            chatbot._session.current_architecture = session_data["current_architecture"]
-
-        # Restore turns
-        for turn_data in session_data.get("turns", []):
-            turn = ArchitectTurn(
-                turn_number=turn_data["turn_number"],
-                user_input=turn_data["user_input"],
-                architect_response=turn_data["architect_response"],
-                architecture_snapshot=turn_data.get("architecture_snapshot", {}),
-                timestamp=turn_data.get("created_at", datetime.now().isoformat()),
-            )
-            chatbot._session.turns.append(turn)
+            session_fields["current_architecture"] = session_data["current_architecture"]
+        chatbot._session = ArchitectSession.from_trusted_dict(session_fields)
 
         # Cache for future requests
         self._chatbots[session_id] = chatbot
@@ -374,63 +388,84 @@ class ArchitectService:
         Returns:
             MessageResponse with AI response and updated state
         """
-        chatbot = await self._get_or_restore_chatbot(session_id)
-        if chatbot is None:
-            return None
-
-        # Analyze mid-chat image if provided
-        if image_base64:
-            try:
-                image_data = base64.b64decode(image_base64)
-                suffix = ".png"
-                if image_filename:
-                    ext = Path(image_filename).suffix.lower()
-                    if ext in (".jpg", ".jpeg", ".png", ".gif", ".webp"):
-                        suffix = ext
-                with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
-                    tmp.write(image_data)
-                    tmp_path = Path(tmp.name)
+        # One request at a time per session: the chatbot's turn history is not
+        # thread-safe, and turn numbers come from its length. The chatbot is
+        # looked up under the lock since a failed save drops it from the cache.
+        async with self._session_lock(session_id):
+            chatbot = await self._get_or_restore_chatbot(session_id)
+            if chatbot is None:
+                return None
+
+            # Analyze mid-chat image if provided
+            if image_base64:
                 try:
-                    chatbot.analyze_reference_image(tmp_path)
-                    logger.info(
-                        "Mid-chat image analyzed for session %s (%d chars)",
-                        session_id,
-                        len(chatbot._reference_image_analysis),
-                    )
-                finally:
-                    tmp_path.unlink(missing_ok=True)
-            except Exception as e:
-                logger.warning("Failed to analyze mid-chat image: %s", e)
-
-        # Process through chatbot
-        response, ready_for_output = chatbot.process_user_input(message)
+                    image_data = base64.b64decode(image_base64)
+                    suffix = ".png"
+                    if image_filename:
+                        ext = Path(image_filename).suffix.lower()
+                        if ext in (".jpg", ".jpeg", ".png", ".gif", ".webp"):
+                            suffix = ext
+                    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+                        tmp.write(image_data)
+                        tmp_path = Path(tmp.name)
+                    try:
+                        await asyncio.to_thread(chatbot.analyze_reference_image, tmp_path)
+                        logger.info(
+                            "Mid-chat image analyzed for session %s (%d chars)",
+                            session_id,
+                            len(chatbot._reference_image_analysis),
+                        )
+                    finally:
+                        tmp_path.unlink(missing_ok=True)
+                except Exception as e:
+                    logger.warning("Failed to analyze mid-chat image: %s", e)
+
+            # Commands (status, help, ...) answer without recording a turn
+            turns_before = len(chatbot._session.turns) if chatbot._session else 0
+
+            # Process through chatbot (blocking LLM call; keep it off the event loop)
+            response, ready_for_output = await asyncio.to_thread(
+                chatbot.process_user_input, message
+            )
 
-        # Get updated architecture state
-        arch = chatbot._session.current_architecture if chatbot._session else {}
-        architecture = self._convert_architecture(arch)
+            # Get updated architecture state
+            arch = chatbot._session.current_architecture if chatbot._session else {}
+            architecture = self._convert_architecture(arch)
 
-        # Get turn number
-        turn_number = len(chatbot._session.turns) if chatbot._session else 0
+            # Get turn number
+            turn_number = len(chatbot._session.turns) if chatbot._session else 0
 
-        # Persist to database
-        store = get_session_store()
+            # Persist to database
+            store = get_session_store()
 
-        # Update session with new architecture
-        await store.update_session(
-            session_id=session_id,
-            architecture=arch,
-        )
+            try:
+                async with store.transaction():
+                    # Update session with new architecture
+                    await store.update_session(
+                        session_id=session_id,
+                        architecture=arch,
+                    )
 
-        # Add turn if it was a normal message (not a command)
-        if chatbot._session and chatbot._session.turns:
-            latest_turn = chatbot._session.turns[-1]
-            await store.add_turn(
-                session_id=session_id,
-                turn_number=latest_turn.turn_number,
-                user_input=latest_turn.user_input,
-                architect_response=latest_turn.architect_response,
-                architecture_snapshot=latest_turn.architecture_snapshot,
-            )
+                    # Add turn if it was a normal message (not a command)
+                    if chatbot._session and len(chatbot._session.turns) > turns_before:
+                        latest_turn = chatbot._session.turns[-1]
+                        added = await store.add_turn(
+                            session_id=session_id,
+                            turn_number=latest_turn.turn_number,
+                            user_input=latest_turn.user_input,
+                            architect_response=latest_turn.architect_response,
+                            architecture_snapshot=latest_turn.architecture_snapshot,
+                        )
+                        if not added:
+                            raise Exception(
+                                f"Failed to save turn {latest_turn.turn_number}"
+                                f" for session {session_id}"
+                            )
+            except Exception:
+                # The chatbot now holds a turn the store rolled back; drop it so
+                # the next request restores the session from the store
+                self._chatbots.pop(session_id, None)
+                raise
 
         return MessageResponse(
             response=response,
@@ -502,7 +537,8 @@ class ArchitectService:
 
         try:
             # Use the chatbot's generate output method
-            response, _ = chatbot.process_user_input("output")
+            async with self._session_lock(session_id):
+                response, _ = await asyncio.to_thread(chatbot.process_user_input, "output")
 
             # Get the output directory
             session = chatbot._session
@@ -618,18 +654,25 @@ class ArchitectService:
             output_dir = Path("outputs") / date_str / run_id
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Generate variant(s)
-            image_urls: list[str] = []
-            for v in range(num_variants):
-                image_bytes, response_text, metadata = image_generator.generate_image(
-                    prompt=prompt,
-                    logo_parts=logo_parts,
-                    **gen_kwargs,
+            # Generate variant(s) concurrently in worker threads; the image
+            # clients are blocking and would otherwise stall the event loop
+            results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        image_generator.generate_image,
+                        prompt=prompt,
+                        logo_parts=logo_parts,
+                        **gen_kwargs,
+                    )
+                    for _ in range(num_variants)
                 )
+            )
+
+            image_urls: list[str] = []
+            for v, (image_bytes, response_text, metadata) in enumerate(results):
                 filename = "diagram.png" if v == 0 else f"diagram_v{v + 1}.png"
                 image_path = output_dir / filename
-                with open(image_path, "wb") as f:
-                    f.write(image_bytes)
+                image_path.write_bytes(image_bytes)
                 image_urls.append(f"/api/images/{date_str}/{run_id}/{filename}")
 
             return GeneratePreviewResponse(
@@ -708,27 +751,29 @@ Requirements:
         Returns:
             ArchitectureState schema
         """
-        components = []
-        for comp in arch.get("components", []):
-            components.append(
-                ComponentSchema(
-                    id=comp.get("id", ""),
-                    label=comp.get("label", ""),
-                    type=comp.get("type", "service"),
-                    logo_name=comp.get("logo_name"),
-                )
-            )
+        components = ComponentListAdapter.validate_python(
+            [
+                {
+                    "id": comp.get("id", ""),
+                    "label": comp.get("label", ""),
+                    "type": comp.get("type", "service"),
+                    "logo_name": comp.get("logo_name"),
+                }
+                for comp in arch.get("components", [])
+            ]
+        )
 
-        connections = []
-        for conn in arch.get("connections", []):
-            connections.append(
-                ConnectionSchema(
-                    from_id=conn.get("from_id", ""),
-                    to_id=conn.get("to_id", ""),
-                    label=conn.get("label"),
-                    style=conn.get("style", "solid"),
-                )
-            )
+        connections = ConnectionListAdapter.validate_python(
+            [
+                {
+                    "from_id": conn.get("from_id", ""),
+                    "to_id": conn.get("to_id", ""),
+                    "label": conn.get("label"),
+                    "style": conn.get("style", "solid"),
+                }
+                for conn in arch.get("connections", [])
+            ]
+        )
 
         return ArchitectureState(
             components=components,
@@ -4,6 +4,7 @@ import json
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from stat import S_ISREG
 from typing import Optional
 
 from ..api.schemas import BestResultItem, PromptFileItem
@@ -49,42 +50,44 @@ class ResultsService:
         if not self.OUTPUTS_DIR.exists():
             return []
 
-        candidates: list[PromptFileItem] = []
+        # One stat per file, newest first, so previews are only read for files
+        # that can still make it into the result
+        files = []
         for path in self.OUTPUTS_DIR.rglob("*prompt*.txt"):
-            if not path.is_file():
+            try:
+                stat = path.stat()
+            except OSError:
                 continue
+            if S_ISREG(stat.st_mode):
+                files.append((stat, path))
+        files.sort(key=lambda f: f[0].st_mtime, reverse=True)
+
+        needle = query.lower().strip() if query else None
+        candidates: list[PromptFileItem] = []
+        for stat, path in files:
+            if len(candidates) >= limit:
+                break
 
             try:
                 relative = path.relative_to(self.OUTPUTS_DIR).as_posix()
             except ValueError:
                 relative = path.as_posix()
 
-            preview = self._safe_read_text(path)[:300]
-            stat = path.stat()
-
-            candidates.append(
-                PromptFileItem(
-                    path=str(path),
-                    relative_path=relative,
-                    preview=preview.strip().replace("\n", " "),
-                    size=stat.st_size,
-                    modified_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                )
+            preview = self._safe_read_text(path, max_chars=300)
+            item = PromptFileItem(
+                path=str(path),
+                relative_path=relative,
+                preview=preview.strip().replace("\n", " "),
+                size=stat.st_size,
+                modified_at=datetime.fromtimestamp(stat.st_mtime).isoformat(),
             )
 
-        # Filter by query
-        if query:
-            needle = query.lower().strip()
-            candidates = [
-                c
-                for c in candidates
-                if needle in c.relative_path.lower() or needle in c.preview.lower()
-            ]
-
-        # Sort by modified_at descending
-        candidates.sort(key=lambda c: c.modified_at or "", reverse=True)
+            # Filter by query
+            if needle and needle not in relative.lower() and needle not in item.preview.lower():
+                continue
+            candidates.append(item)
 
-        return candidates[:limit]
+        return candidates
 
     def list_best_results(
         self,
@@ -369,9 +372,12 @@ class ResultsService:
         except Exception:
             return None
 
-    def _safe_read_text(self, path: Path) -> str:
+    def _safe_read_text(self, path: Path, max_chars: Optional[int] = None) -> str:
         try:
-            return path.read_text()
+            if max_chars is None:
+                return path.read_text()
+            with path.open() as f:
+                return f.read(max_chars)
         except Exception:
             return ""
 
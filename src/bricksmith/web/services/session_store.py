@@ -2,7 +2,8 @@
 
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 from ..api.schemas import SessionResponse
 
@@ -37,6 +38,10 @@ class SessionStore(ABC):
         """Get a session by ID."""
         pass
 
+    async def session_exists(self, session_id: str) -> bool:
+        """Check whether a session exists without loading its architecture."""
+        return await self.get_session(session_id) is not None
+
     @abstractmethod
     async def list_sessions(
         self,
@@ -83,6 +88,15 @@ class SessionStore(ABC):
         """Get complete session data including turns and architecture."""
         pass
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """Group several writes so they are committed together.
+
+        Backends that cannot hold a transaction across calls commit each
+        write as it happens.
+        """
+        yield
+
 
 # Singleton instance
 _session_store: Optional[SessionStore] = None
@@ -0,0 +1,44 @@
+"""Tests for generate-raw's logo mapping helpers."""
+
+from pathlib import Path
+
+from bricksmith.cli import _logo_image_number, _logo_name_variants
+from bricksmith.models import LogoInfo
+
+
+def test_logo_name_variants_are_distinct_aliases():
+    """Spaced and suffix-free aliases are generated once each, in order."""
+    assert _logo_name_variants("delta-lake_logo") == [
+        "delta-lake_logo",
+        "delta lake logo",
+        "delta-lake",
+    ]
+    assert _logo_name_variants("databricks") == ["databricks"]
+
+
+def test_unity_catalog_logos_match_governance_terms():
+    """Unity Catalog logos are also matched by their common synonyms."""
+    variants = _logo_name_variants("unity-catalog")
+
+    assert variants[:2] == ["unity-catalog", "unity catalog"]
+    assert {"uc", "governance", "catalog"} <= set(variants)
+    assert len(variants) == len(set(variants))
+
+
+def test_logo_image_number_is_one_based():
+    """The first logo whose name contains the keyword gives its image number."""
+    logos = [
+        LogoInfo(
+            name=name,
+            description=f"{name} logo",
+            file_path=Path(f"{name}.png"),
+            sha256_hash=name,
+            content_type="image/png",
+            size_bytes=1,
+        )
+        for name in ("databricks", "azure", "delta-lake")
+    ]
+
+    assert _logo_image_number(logos, "databricks") == 1
+    assert _logo_image_number(logos, "delta") == 3
+    assert _logo_image_number(logos, "aws") is None
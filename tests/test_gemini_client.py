@@ -0,0 +1,32 @@
+"""Tests for GeminiClient's shared client and request-part caches."""
+
+from bricksmith import gemini_client
+from bricksmith.gemini_client import GeminiClient, _get_logo_part
+
+
+def test_clients_with_the_same_api_key_share_one_genai_client():
+    """Instances reuse one pooled genai client per API key."""
+    first = GeminiClient(api_key="key-a")
+    second = GeminiClient(api_key="key-a", model="gemini-2.5-flash")
+    other = GeminiClient(api_key="key-b")
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert second.model == "gemini-2.5-flash"
+
+
+def test_logo_parts_are_built_once_per_image(monkeypatch):
+    """The same logo bytes and MIME type reuse one Part; the cache stays bounded."""
+    monkeypatch.setattr(gemini_client, "_LOGO_PARTS", {})
+    monkeypatch.setattr(gemini_client, "_LOGO_PARTS_MAX", 2)
+    logo = b"\x89PNG logo bytes"
+
+    part = _get_logo_part(logo, "image/png")
+
+    assert _get_logo_part(bytes(logo), "image/png") is part
+    assert part.inline_data.data == logo
+    assert part.inline_data.mime_type == "image/png"
+    assert _get_logo_part(logo, "image/jpeg") is not part
+
+    _get_logo_part(b"another logo", "image/png")
+    assert len(gemini_client._LOGO_PARTS) <= 2
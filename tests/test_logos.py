@@ -0,0 +1,56 @@
+"""Tests for the process-wide logo caches in LogoKitHandler."""
+
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from bricksmith import logos
+from bricksmith.config import LogoKitConfig
+from bricksmith.logos import LogoKitHandler
+
+
+@pytest.fixture()
+def handler(monkeypatch) -> LogoKitHandler:
+    """A handler whose shared caches start empty."""
+    monkeypatch.setattr(logos, "_LOADED_LOGOS", OrderedDict())
+    monkeypatch.setattr(logos, "_LOGO_BYTES", OrderedDict())
+    return LogoKitHandler(LogoKitConfig())
+
+
+def _write_logo(path: Path, color: str) -> Path:
+    Image.new("RGB", (4, 4), color).save(path)
+    return path
+
+
+def test_changed_logo_replaces_its_cache_entry(handler: LogoKitHandler, tmp_path: Path):
+    """Editing a logo file reloads it and drops the stale entry and bytes."""
+    path = _write_logo(tmp_path / "databricks.png", "red")
+    first = handler._load_single_logo(path)
+    handler.to_image_part(first)
+
+    _write_logo(path, "blue")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = handler._load_single_logo(path)
+
+    assert second.sha256_hash != first.sha256_hash
+    assert handler._load_single_logo(path) is second
+    assert len(logos._LOADED_LOGOS) == 1
+    assert first.sha256_hash not in logos._LOGO_BYTES
+
+
+def test_logo_caches_are_bounded(handler: LogoKitHandler, tmp_path: Path, monkeypatch):
+    """The least recently used logos are evicted once the caches are full."""
+    monkeypatch.setattr(logos, "_LOADED_LOGOS_MAX", 2)
+    monkeypatch.setattr(logos, "_LOGO_BYTES_MAX", 2)
+    paths = [_write_logo(tmp_path / f"{name}.png", name) for name in ("red", "green", "blue")]
+
+    loaded = [handler._load_single_logo(path) for path in paths]
+    for logo in loaded:
+        assert handler.to_image_part(logo)["data"] == logo.file_path.read_bytes()
+
+    assert list(logos._LOADED_LOGOS) == [path.resolve() for path in paths[1:]]
+    assert list(logos._LOGO_BYTES) == [logo.sha256_hash for logo in loaded[1:]]
@@ -0,0 +1,125 @@
+"""Tests for MLflowTracker run lifecycle, parameter batching and artifact uploads."""
+
+import json
+from pathlib import Path
+
+import mlflow
+import pytest
+
+from bricksmith.config import MLflowConfig
+from bricksmith.mlflow_tracker import MLflowTracker
+
+
+@pytest.fixture(scope="module")
+def tracking_dir(tmp_path_factory) -> Path:
+    """Share one SQLite-backed tracking store across the module (creating it is slow)."""
+    return tmp_path_factory.mktemp("mlflow")
+
+
+@pytest.fixture()
+def tracker(tracking_dir: Path):
+    """An initialized tracker writing to the temporary tracking store."""
+    previous_uri = mlflow.get_tracking_uri()
+    tracker = MLflowTracker(
+        MLflowConfig(
+            tracking_uri=f"sqlite:///{tracking_dir / 'mlflow.db'}",
+            experiment_name="bricksmith-tests",
+            artifact_location=str(tracking_dir / "artifacts"),
+        )
+    )
+    tracker.initialize()
+
+    yield tracker
+
+    if mlflow.active_run() is not None:
+        mlflow.end_run()
+    tracker.close()
+    mlflow.set_tracking_uri(previous_uri)
+
+
+def _fail_upload(run_id):
+    raise RuntimeError("upload failed")
+
+
+def test_end_run_marks_run_failed_when_an_upload_fails(tracker: MLflowTracker):
+    """A failed artifact upload should close the run as FAILED, then raise."""
+    run_id = tracker.start_run(params={"temperature": 0.4})
+    tracker._submit_upload(_fail_upload)
+
+    with pytest.raises(RuntimeError, match="upload failed"):
+        tracker.end_run("FINISHED")
+
+    run = mlflow.get_run(run_id)
+    assert run.info.status == "FAILED"
+    assert run.data.params == {"temperature": "0.4"}
+    assert mlflow.active_run() is None
+
+
+def test_end_run_after_close_is_a_no_op(tracker: MLflowTracker):
+    """Callers that end_run("FAILED") in an except block must not touch a closed run."""
+    run_id = tracker.start_run()
+    tracker.end_run("FINISHED")
+
+    tracker.end_run("FAILED")
+
+    assert mlflow.get_run(run_id).info.status == "FINISHED"
+
+
+def test_parameters_are_sent_with_metrics_in_one_batch(tracker: MLflowTracker, monkeypatch):
+    """Buffered parameters reach the server in the same log_batch as the metrics."""
+    run_id = tracker.start_run()
+    client = tracker._get_client()
+    batches = []
+    log_batch = client.log_batch
+
+    def recording_log_batch(run_id, metrics=(), params=(), **kwargs):
+        batches.append(({m.key for m in metrics}, {p.key for p in params}))
+        return log_batch(run_id, metrics=metrics, params=params, **kwargs)
+
+    monkeypatch.setattr(client, "log_batch", recording_log_batch)
+
+    tracker.log_parameters({"model": "gemini", "layout": {"zones": 3}})
+    tracker.log_parameters({"temperature": 0.4})
+    assert batches == []
+
+    tracker.log_metrics({"score": 0.9})
+    tracker.end_run("FINISHED")
+
+    assert batches == [({"score"}, {"model", "layout", "temperature"})]
+    run = mlflow.get_run(run_id)
+    assert json.loads(run.data.params.pop("layout")) == {"zones": 3}
+    assert run.data.params == {"model": "gemini", "temperature": "0.4"}
+    assert run.data.metrics == {"score": 0.9}
+
+
+def test_end_run_sends_parameters_logged_after_the_last_metrics(tracker: MLflowTracker):
+    """Parameters still buffered at end_run are not lost."""
+    run_id = tracker.start_run()
+    tracker.log_metrics({"score": 0.5})
+    tracker.log_parameters({"late": "yes"})
+
+    tracker.end_run("FINISHED")
+
+    assert mlflow.get_run(run_id).data.params == {"late": "yes"}
+
+
+def test_parameters_outside_start_run_go_to_the_active_run(tracker: MLflowTracker):
+    """Without start_run() parameters are logged straight away, not buffered."""
+    with mlflow.start_run() as run:
+        tracker.log_parameters({"model": "gemini"})
+
+        assert tracker._pending_params == {}
+        assert mlflow.get_run(run.info.run_id).data.params == {"model": "gemini"}
+
+
+def test_artifact_uploads_finish_before_the_run_ends(tracker: MLflowTracker):
+    """Background uploads are flushed by end_run and readable afterwards."""
+    run_id = tracker.start_run()
+    future = tracker.log_prompt("draw a lakehouse", filename="main.txt")
+
+    tracker.end_run("FINISHED")
+
+    assert future.done()
+    path = Path(tracker.download_artifact(run_id, "prompts/main.txt"))
+    assert path.read_text() == "draw a lakehouse"
+    assert mlflow.get_run(run_id).info.status == "FINISHED"
@@ -0,0 +1,122 @@
+"""Tests for the core pydantic models."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from bricksmith.models import (
+    ArchitectSession,
+    ArchitectTurn,
+    ConversationSession,
+    ConversationStatus,
+    ConversationTurn,
+    EvaluationScores,
+    LogoInfo,
+)
+
+
+def _scores(**overrides) -> EvaluationScores:
+    values = {
+        "logo_fidelity_score": 8,
+        "layout_clarity_score": 6,
+        "text_legibility_score": 9,
+        "constraint_compliance_score": 7,
+    }
+    values.update(overrides)
+    return EvaluationScores(**values)
+
+
+def test_overall_score_is_the_mean_of_the_dimensions():
+    """overall_score is derived at construction and ignores any value passed in."""
+    assert _scores().overall_score == 7.5
+    assert _scores(overall_score=1.0).overall_score == 7.5
+    assert _scores(notes="ok").to_dict() == {
+        "logo_fidelity_score": 8,
+        "layout_clarity_score": 6,
+        "text_legibility_score": 9,
+        "constraint_compliance_score": 7,
+        "notes": "ok",
+        "overall_score": 7.5,
+    }
+
+
+def test_value_models_are_immutable():
+    """LogoInfo and EvaluationScores reject assignment once built."""
+    logo = LogoInfo(
+        name="databricks",
+        description="red icon",
+        file_path=Path("databricks.png"),
+        sha256_hash="abc",
+        content_type="image/png",
+        size_bytes=10,
+    )
+    scores = _scores()
+
+    with pytest.raises(ValidationError):
+        logo.name = "delta"
+    with pytest.raises(ValidationError):
+        scores.logo_fidelity_score = 1
+    assert scores.overall_score == 7.5
+    assert hash(logo) == hash(logo.model_copy())
+
+
+def test_architect_turns_are_immutable():
+    """Recorded architect turns cannot be edited through the session."""
+    session = ArchitectSession(session_id="s1", initial_problem="problem")
+    session.add_turn(ArchitectTurn(turn_number=1, user_input="hi", architect_response="hello"))
+
+    with pytest.raises(ValidationError):
+        session.turns[0].architect_response = "changed"
+    assert session.turns[0].architect_response == "hello"
+
+
+def test_conversation_session_from_trusted_dict_builds_turn_models():
+    """Saved sessions are rebuilt with typed turns and default fields filled in."""
+    session = ConversationSession.from_trusted_dict(
+        {
+            "session_id": "s1",
+            "initial_prompt": "draw it",
+            "status": ConversationStatus.ACTIVE,
+            "turns": [
+                {
+                    "iteration": 1,
+                    "prompt_used": "first",
+                    "run_id": "r1",
+                    "image_path": Path("one.png"),
+                    "generation_time_seconds": 1.0,
+                    "score": 6,
+                },
+                {
+                    "iteration": 2,
+                    "prompt_used": "second",
+                    "run_id": "r2",
+                    "image_path": Path("two.png"),
+                    "generation_time_seconds": 1.0,
+                    "score": 9,
+                },
+            ],
+        }
+    )
+
+    assert all(isinstance(turn, ConversationTurn) for turn in session.turns)
+    assert session.turns[0].variant_paths == []
+    assert session.current_prompt_override is None
+    assert session.get_best_turn().run_id == "r2"
+    assert session.get_latest_prompt() == "second"
+
+
+def test_architect_session_from_trusted_dict_builds_turn_models():
+    """Architect sessions restored from the store get ArchitectTurn instances."""
+    session = ArchitectSession.from_trusted_dict(
+        {
+            "session_id": "s1",
+            "initial_problem": "problem",
+            "turns": [{"turn_number": 1, "user_input": "hi", "architect_response": "hello"}],
+        }
+    )
+
+    assert isinstance(session.turns[0], ArchitectTurn)
+    assert session.turns[0].architecture_snapshot is None
+    assert session.current_architecture == {"components": [], "connections": []}
+    assert session.status == ConversationStatus.ACTIVE
@@ -0,0 +1,108 @@
+"""Tests for PromptRefiner's handling of Gemini's structured responses."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bricksmith.prompt_refiner import PromptRefiner
+
+
+class _FakeGeminiClient:
+    """Returns a canned response and records each vision request."""
+
+    model = "fake-model"
+
+    def __init__(self, response: str):
+        self.response = response
+        self.requests = []
+
+    def analyze_image(self, image_path, prompt, **config) -> str:
+        self.requests.append(config)
+        return self.response
+
+
+@pytest.fixture()
+def image_path(tmp_path: Path) -> Path:
+    path = tmp_path / "diagram.png"
+    path.write_bytes(b"png bytes")
+    return path
+
+
+def _refiner(response: str) -> PromptRefiner:
+    return PromptRefiner(
+        gemini_client=_FakeGeminiClient(response), mlflow_tracker=None, prompt_builder=None
+    )
+
+
+def test_analysis_is_parsed_from_json(image_path: Path):
+    """A schema-conforming response is returned as structured fields."""
+    response = json.dumps(
+        {"strengths": ["clear flow"], "weaknesses": ["small text"], "observations": "ok"}
+    )
+
+    analysis = _refiner(response).analyze_diagram(image_path, "draw it")
+
+    assert analysis == {
+        "strengths": ["clear flow"],
+        "weaknesses": ["small text"],
+        "observations": "ok",
+    }
+
+
+def test_analysis_falls_back_to_raw_text(image_path: Path):
+    """A response that is not JSON is kept as the observations."""
+    analysis = _refiner("The diagram looks fine.").analyze_diagram(image_path, "draw it")
+
+    assert analysis == {
+        "strengths": [],
+        "weaknesses": [],
+        "observations": "The diagram looks fine.",
+    }
+
+
+def test_improvements_are_parsed_from_json(image_path: Path):
+    """Analysis and the refined prompt come back from one structured response."""
+    response = json.dumps(
+        {
+            "analysis": {"strengths": [], "weaknesses": ["no arrows"], "observations": ""},
+            "refined_prompt": "draw it with arrows",
+            "key_changes": ["add arrows"],
+        }
+    )
+
+    refinement = _refiner(response).suggest_improvements(image_path, "draw it")
+
+    assert refinement.refined_prompt == "draw it with arrows"
+    assert refinement.changes == ["add arrows"]
+    assert refinement.expected_improvements == []
+    assert refinement.analysis["weaknesses"] == ["no arrows"]
+
+
+def test_improvements_keep_the_original_prompt_when_response_is_invalid(image_path: Path):
+    """A response missing the refined prompt leaves the prompt unchanged."""
+    response = json.dumps({"analysis": {"strengths": ["good"]}})
+
+    refinement = _refiner(response).suggest_improvements(image_path, "draw it")
+
+    assert refinement.refined_prompt == "draw it"
+    assert refinement.changes == []
+    assert refinement.analysis["observations"] == response
+
+
+def test_comparison_falls_back_to_empty_lists():
+    """An unparseable comparison still carries the raw text."""
+    refiner = _refiner("")
+
+    assert refiner._parse_comparison_response('{"recommendations": ["use A\'s colors"]}') == {
+        "visual_differences": [],
+        "prompt_differences": [],
+        "recommendations": ["use A's colors"],
+        "raw_analysis": '{"recommendations": ["use A\'s colors"]}',
+    }
+    assert refiner._parse_comparison_response("A is better.") == {
+        "visual_differences": [],
+        "prompt_differences": [],
+        "recommendations": [],
+        "raw_analysis": "A is better.",
+    }
@@ -0,0 +1,34 @@
+"""Tests for PromptBuilder's logo kit section."""
+
+from pathlib import Path
+
+from bricksmith.models import LogoInfo
+from bricksmith.prompts import PromptBuilder
+
+
+def _logo(name: str, description: str = "") -> LogoInfo:
+    return LogoInfo(
+        name=name,
+        description=description or f"{name} logo",
+        file_path=Path(f"{name}.png"),
+        sha256_hash=name,
+        content_type="image/png",
+        size_bytes=1,
+    )
+
+
+def test_logo_section_uses_display_names_without_filename_conventions():
+    """Hyphens and underscores become spaces and convention suffixes are dropped."""
+    section = PromptBuilder()._build_logo_section(
+        [
+            _logo("delta-lake-logo", "teal/cyan triangle icon"),
+            _logo("unity_catalog-solo"),
+            _logo("mlflow-logo-final-black"),
+        ]
+    )
+
+    lines = section.splitlines()
+    assert "- Delta Lake: teal/cyan triangle icon" in lines
+    assert "- Unity Catalog" in lines
+    assert "- Mlflow" in lines
+    assert "-logo" not in section and "_" not in section
@@ -15,6 +15,8 @@ from bricksmith.web.services import results_service as results_service_module
 from bricksmith.web.services import session_store as session_store_module
 from bricksmith.web.db.sqlite import SQLiteSessionStore
 
+ASSET_REF_RE = re.compile(r'(?:src|href)="(/assets/[^"]+)"')
+
 
 @pytest.fixture()
 def isolated_sqlite_store(tmp_path: Path):
@@ -81,7 +83,7 @@ def test_root_serves_existing_built_assets():
         assert index_response.status_code == 200
 
         html = index_response.text
-        asset_paths = re.findall(r'(?:src|href)="(/assets/[^"]+)"', html)
+        asset_paths = ASSET_REF_RE.findall(html)
         assert asset_paths, "Expected built asset references in index.html"
 
         for asset_path in asset_paths:
@@ -125,3 +127,28 @@ def test_best_results_reads_chat_prompt_file_fallback(tmp_path: Path, monkeypatc
         assert result["prompt_path"].endswith("iteration_9_prompt.txt")
         assert result["prompt_preview"].startswith("Design a medallion architecture")
         assert result["full_prompt"] == prompt_text
+
+
+def test_list_sessions_honours_if_none_match(isolated_sqlite_store: SQLiteSessionStore):
+    """`/api/sessions` answers 304 until the session list changes."""
+    app = create_app()
+    with TestClient(app) as client:
+        first = client.get("/api/sessions")
+        etag = first.headers["etag"]
+
+        unchanged = client.get("/api/sessions", headers={"If-None-Match": etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+
+        conn = sqlite3.connect(isolated_sqlite_store.db_path)
+        conn.execute(
+            "INSERT INTO sessions (session_id, initial_problem) VALUES (?, ?)",
+            ("new01", "New problem"),
+        )
+        conn.commit()
+        conn.close()
+
+        changed = client.get("/api/sessions", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total"] == 1
+        assert changed.headers["etag"] != etag
@@ -1,11 +1,14 @@
 """Regression tests for ArchitectService edge cases."""
 
+import asyncio
+import time
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
 from bricksmith.web.api.schemas import SessionResponse
+from bricksmith.web.db.sqlite import SQLiteSessionStore
 from bricksmith.web.services.architect_service import ArchitectService
 
 
@@ -81,3 +84,75 @@ async def test_create_session_passes_path_to_logo_loader(monkeypatch):
     response = await service.create_session(initial_problem="Test problem")
 
     assert response.initial_problem == "Test problem"
+
+
+class _SlowTurnChatbot:
+    """Chatbot whose turn numbering races if two messages run at once."""
+
+    def __init__(self):
+        self._session = SimpleNamespace(
+            turns=[], current_architecture={"components": [], "connections": []}
+        )
+
+    def process_user_input(self, message: str):
+        turn_number = len(self._session.turns) + 1
+        time.sleep(0.05)
+        self._session.turns.append(
+            SimpleNamespace(
+                turn_number=turn_number,
+                user_input=message,
+                architect_response=f"reply to {message}",
+                architecture_snapshot=None,
+            )
+        )
+        return f"reply to {message}", False
+
+
+@pytest.fixture()
+async def sqlite_store(tmp_path: Path, monkeypatch):
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"))
+    await store.initialize()
+    monkeypatch.setattr(
+        "bricksmith.web.services.architect_service.get_session_store",
+        lambda: store,
+    )
+    yield store
+    await store.close()
+
+
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+@pytest.mark.anyio
+async def test_send_message_serializes_turns_per_session(sqlite_store: SQLiteSessionStore):
+    """Concurrent messages to one session should each be saved with their own turn."""
+    await sqlite_store.create_session("s1", "Test problem")
+    service = ArchitectService()
+    service._chatbots["s1"] = _SlowTurnChatbot()
+
+    await asyncio.gather(
+        service.send_message("s1", "first"),
+        service.send_message("s1", "second"),
+    )
+
+    turns = await sqlite_store.get_turns("s1")
+    assert [turn["turn_number"] for turn in turns] == [1, 2]
+    assert [turn["user_input"] for turn in turns] == ["first", "second"]
+    # Locks are not kept once no request holds or waits for them
+    assert "s1" not in service._session_locks
+
+
+@pytest.mark.parametrize("anyio_backend", ["asyncio"])
+@pytest.mark.anyio
+async def test_send_message_raises_when_turn_is_not_saved(sqlite_store: SQLiteSessionStore):
+    """A turn the store rejects should fail the request and roll back the update."""
+    await sqlite_store.create_session("s1", "Test problem")
+    await sqlite_store.add_turn("s1", 1, "stale", "stale reply")
+    service = ArchitectService()
+    service._chatbots["s1"] = _SlowTurnChatbot()
+
+    with pytest.raises(Exception, match="Failed to save turn 1"):
+        await service.send_message("s1", "first")
+
+    session = await sqlite_store.get_session("s1")
+    assert session.current_architecture is None
+    # The chatbot holding the unsaved turn is dropped, to be restored from the store
+    assert "s1" not in service._chatbots
@@ -0,0 +1,50 @@
+"""Tests for conditional GET responses."""
+
+from starlette.requests import Request
+
+from bricksmith.web.api.etag import etag_json_response
+
+BODY = b'{"sessions":[],"total":0}'
+
+
+def _request(if_none_match=None) -> Request:
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _etag() -> str:
+    return etag_json_response(_request(), BODY).headers["etag"]
+
+
+def test_response_carries_body_and_etag():
+    """Without If-None-Match the JSON body is returned with a quoted ETag."""
+    response = etag_json_response(_request(), BODY)
+
+    assert response.status_code == 200
+    assert response.body == BODY
+    assert response.media_type == "application/json"
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["etag"] == _etag()
+
+
+def test_matching_etag_returns_not_modified():
+    """A client holding the current body gets a bodiless 304."""
+    etag = _etag()
+
+    for header in (etag, f"W/{etag}", f'"stale", {etag}', "*"):
+        response = etag_json_response(_request(header), BODY)
+        assert response.status_code == 304, header
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+
+
+def test_changed_body_gets_a_new_etag():
+    """A stale If-None-Match gets the new body."""
+    stale = _etag()
+
+    response = etag_json_response(_request(stale), b'{"sessions":[],"total":1}')
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != stale
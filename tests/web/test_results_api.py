@@ -0,0 +1,87 @@
+"""Tests for the document-to-prompt endpoint's caching."""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+
+import pytest
+
+from bricksmith.web.api import results
+from bricksmith.web.api.schemas import GenerateFromDocRequest
+
+
+@pytest.fixture()
+def anyio_backend():
+    """Generations are cached and coalesced with asyncio tasks."""
+    return "asyncio"
+
+
+class _FakeGeminiClient:
+    """Counts generate_text calls and answers slowly so requests overlap."""
+
+    model = "fake-model"
+
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_text(self, prompt: str, **kwargs) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        return f"  prompt #{self.calls}  "
+
+
+@pytest.fixture()
+def fake_client(monkeypatch):
+    """Route generation to a fake client with empty caches."""
+    client = _FakeGeminiClient()
+    monkeypatch.setattr(results, "_doc_prompt_client", client)
+    monkeypatch.setattr(results, "_GENERATED_PROMPTS", OrderedDict())
+    monkeypatch.setattr(results, "_PENDING_GENERATIONS", {})
+    return client
+
+
+def test_doc_prompt_client_reads_the_api_key_from_the_environment(monkeypatch):
+    """The shared client is created from GEMINI_API_KEY on first use."""
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(results, "_doc_prompt_client", None)
+
+    client = results._get_doc_prompt_client()
+
+    assert client.api_key == "test-key"
+    assert results._get_doc_prompt_client() is client
+
+
+@pytest.mark.anyio
+async def test_generated_prompt_cache_is_bounded(fake_client, monkeypatch):
+    """The oldest generated prompt is evicted once the cache is full."""
+    monkeypatch.setattr(results, "_GENERATED_PROMPTS_MAX", 2)
+
+    for text in ("doc a", "doc b", "doc c"):
+        await results.generate_prompt_from_doc(GenerateFromDocRequest(document_text=text))
+    assert len(results._GENERATED_PROMPTS) == 2
+
+    await results.generate_prompt_from_doc(GenerateFromDocRequest(document_text="doc c"))
+    assert fake_client.calls == 3
+
+    await results.generate_prompt_from_doc(GenerateFromDocRequest(document_text="doc a"))
+    assert fake_client.calls == 4
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_documents_share_one_generation(fake_client):
+    """Duplicate submissions in flight at once make a single Gemini call."""
+    request = GenerateFromDocRequest(document_text="Lakehouse with streaming ingest")
+
+    responses = await asyncio.gather(*(results.generate_prompt_from_doc(request) for _ in range(3)))
+
+    assert fake_client.calls == 1
+    assert {r.prompt for r in responses} == {"prompt #1"}
+    assert results._PENDING_GENERATIONS == {}
+
+    # A later resubmission is answered from the cache
+    again = await results.generate_prompt_from_doc(request)
+    assert again.prompt == "prompt #1"
+    assert fake_client.calls == 1
@@ -0,0 +1,211 @@
+"""Tests for the SQLite session store."""
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from bricksmith.web.db import sqlite as sqlite_module
+from bricksmith.web.db.sqlite import SQLiteSessionStore
+
+
+@pytest.fixture()
+def anyio_backend():
+    """The store runs its database work through asyncio's executor."""
+    return "asyncio"
+
+
+@pytest.fixture()
+async def store(tmp_path: Path):
+    """An initialized store backed by a temporary database file."""
+    store = SQLiteSessionStore(db_path=str(tmp_path / "sessions.db"))
+    await store.initialize()
+    yield store
+    await store.close()
+
+
+def _committed_status(store: SQLiteSessionStore, session_id: str):
+    """Read a session's status through a separate connection (committed data only)."""
+    conn = sqlite3.connect(store.db_path)
+    try:
+        row = conn.execute(
+            "SELECT status FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+    finally:
+        conn.close()
+    return row[0] if row else None
+
+
+@pytest.mark.anyio
+async def test_transaction_commits_writes_together(store: SQLiteSessionStore):
+    """Writes inside transaction() are committed when the block exits."""
+    await store.create_session("s1", "problem")
+
+    async with store.transaction():
+        await store.update_session("s1", status="completed")
+        assert await store.add_turn("s1", 1, "hi", "hello")
+        assert _committed_status(store, "s1") == "active"
+
+    assert _committed_status(store, "s1") == "completed"
+    assert len(await store.get_turns("s1")) == 1
+
+
+@pytest.mark.anyio
+async def test_transaction_rolls_back_on_error(store: SQLiteSessionStore):
+    """An exception inside transaction() discards its writes and cached reads."""
+    await store.create_session("s1", "problem")
+
+    with pytest.raises(RuntimeError):
+        async with store.transaction():
+            await store.update_session("s1", status="completed")
+            await store.add_turn("s1", 1, "hi", "hello")
+            raise RuntimeError("boom")
+
+    session = await store.get_session("s1")
+    assert session.status == "active"
+    assert session.turn_count == 0
+    assert await store.get_turns("s1") == []
+
+
+@pytest.mark.anyio
+async def test_other_tasks_do_not_join_an_open_transaction(store: SQLiteSessionStore):
+    """A rollback must not discard writes made by other requests meanwhile."""
+    await store.create_session("s1", "problem")
+    inside = asyncio.Event()
+
+    async def failing_turn():
+        async with store.transaction():
+            await store.update_session("s1", status="completed")
+            inside.set()
+            # Let the other request run while the transaction is open
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+
+    async def other_request():
+        await inside.wait()
+        await store.create_session("s2", "other problem")
+
+    results = await asyncio.gather(failing_turn(), other_request(), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert _committed_status(store, "s1") == "active"
+    assert _committed_status(store, "s2") == "active"
+
+
+@pytest.mark.anyio
+async def test_get_session_returns_copies_of_cached_sessions(store: SQLiteSessionStore):
+    """Changing a returned session must not change what later reads see."""
+    created = await store.create_session("s1", "problem")
+    created.status = "mutated"
+
+    first = await store.get_session("s1")
+    first.status = "mutated"
+
+    second = await store.get_session("s1")
+    assert second.status == "active"
+    assert second is not first
+
+
+@pytest.mark.anyio
+async def test_writes_refresh_cached_sessions(store: SQLiteSessionStore):
+    """Cache hits reflect every write made through the store."""
+    await store.create_session("s1", "problem")
+    await store.get_session("s1")
+
+    await store.update_session("s1", architecture={"components": []}, status="completed")
+    assert await store.add_turn("s1", 1, "hi", "hello")
+
+    session = await store.get_session("s1")
+    assert session.status == "completed"
+    assert session.turn_count == 1
+
+    assert await store.delete_session("s1")
+    assert await store.get_session("s1") is None
+    assert not await store.session_exists("s1")
+
+
+@pytest.mark.anyio
+async def test_add_turn_rejects_duplicates_and_unknown_sessions(store: SQLiteSessionStore):
+    """add_turn returns False rather than raising when the turn cannot be stored."""
+    await store.create_session("s1", "problem")
+
+    assert await store.add_turn("s1", 1, "hi", "hello")
+    assert not await store.add_turn("s1", 1, "again", "ignored")
+    assert not await store.add_turn("missing", 1, "hi", "hello")
+    assert not store._conn.in_transaction
+
+    turns = await store.get_turns("s1")
+    assert [(t["turn_number"], t["user_input"]) for t in turns] == [(1, "hi")]
+
+
+@pytest.mark.anyio
+async def test_update_session_returns_the_updated_row(store: SQLiteSessionStore):
+    """update_session answers from its RETURNING row, including turn_count."""
+    await store.create_session("s1", "problem")
+    assert await store.add_turn("s1", 1, "hi", "hello")
+
+    session = await store.update_session(
+        "s1", architecture={"components": [{"id": "a", "label": "A"}]}, status="completed"
+    )
+
+    assert session.status == "completed"
+    assert session.turn_count == 1
+    assert [c.id for c in session.current_architecture.components] == ["a"]
+    assert _committed_status(store, "s1") == "completed"
+
+
+@pytest.mark.anyio
+async def test_update_session_of_missing_session_returns_none(store: SQLiteSessionStore):
+    """Updating an unknown session reports None instead of raising."""
+    assert await store.update_session("missing", status="completed") is None
+
+
+@pytest.mark.anyio
+async def test_get_full_session_data_returns_turns_in_order(store: SQLiteSessionStore):
+    """Turns aggregated by SQLite come back ordered by turn number."""
+    await store.create_session("s1", "problem", reference_prompt="ref")
+    assert await store.add_turn("s1", 2, "second", "b")
+    assert await store.add_turn("s1", 1, "first", "a", architecture_snapshot={"components": []})
+
+    data = await store.get_full_session_data("s1")
+
+    assert data["reference_prompt"] == "ref"
+    assert [t["user_input"] for t in data["turns"]] == ["first", "second"]
+    assert data["turns"][0]["architecture_snapshot"] == {"components": []}
+    assert await store.get_full_session_data("missing") is None
+
+
+@pytest.mark.anyio
+async def test_session_cache_evicts_least_recently_used(store: SQLiteSessionStore, monkeypatch):
+    """The session cache stays within its size, dropping the oldest unused entry."""
+    monkeypatch.setattr(sqlite_module, "_SESSION_CACHE_SIZE", 2)
+    for session_id in ("s1", "s2"):
+        await store.create_session(session_id, "problem")
+    # Touch s1 so s2 is the least recently used
+    await store.get_session("s1")
+    await store.create_session("s3", "problem")
+
+    assert list(store._session_cache) == ["s1", "s3"]
+    session = await store.get_session("s2")
+    assert session.session_id == "s2"
+
+
+@pytest.mark.anyio
+async def test_store_calls_run_off_the_event_loop(store: SQLiteSessionStore, monkeypatch):
+    """Blocking sqlite3 work happens on the store's database thread."""
+    threads = []
+    connect = store._get_connection
+
+    def recording_connection():
+        threads.append(threading.current_thread().name)
+        return connect()
+
+    monkeypatch.setattr(store, "_get_connection", recording_connection)
+
+    await store.create_session("s1", "problem")
+    await store.list_sessions()
+
+    assert threads
+    assert all(name.startswith("sqlite-store") for name in threads)